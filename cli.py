@@ -167,12 +167,8 @@ def cli_suppliers(args):
         except Exception:
             df = read_csv_flex(path)
         changed = 0
-        for _, row in df.iterrows():
-            raw_name = _to_str(row.get("Supplier")).strip()
-            if not raw_name or raw_name == "-":
-                continue
+        for s in Supplier.from_dataframe(df):
             try:
-                s = Supplier.from_any({k: row[k] for k in df.columns if k in row})
                 if args.btw and not s.btw:
                     s.btw = args.btw
                 if args.adres_1 and not s.adres_1:
@@ -5,7 +5,7 @@ from typing import List, Optional
 
 from models import Client
 from app_paths import data_file
-from helpers import favorite_prefix
+from helpers import favorite_prefix, json_loads
 
 CLIENTS_DB_FILE = data_file("clients_db.json")
 _FAVORITE_PREFIX = favorite_prefix()
@@ -20,8 +20,8 @@ class ClientsDB:
         if not os.path.exists(path):
             return ClientsDB()
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            with open(path, "rb") as f:
+                data = json_loads(f.read())
             if isinstance(data, list):
                 recs = data
             else:
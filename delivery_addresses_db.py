@@ -6,7 +6,7 @@ from typing import List, Optional
 from models import DeliveryAddress
 from clients_db import ClientsDB, CLIENTS_DB_FILE
 from app_paths import data_file
-from helpers import favorite_prefix
+from helpers import favorite_prefix, json_loads
 
 DELIVERY_DB_FILE = data_file("delivery_addresses_db.json")
 _FAVORITE_PREFIX = favorite_prefix()
@@ -15,6 +15,8 @@ _FAVORITE_PREFIX = favorite_prefix()
 class DeliveryAddressesDB:
     def __init__(self, addresses: Optional[List[DeliveryAddress]] = None):
         self.addresses: List[DeliveryAddress] = addresses or []
+        # Verhoogd bij elke wijziging zodat UI-lijsten hun opties kunnen cachen
+        self.version = 0
 
     @staticmethod
     def _copy_from_clients() -> List[DeliveryAddress]:
@@ -36,8 +38,8 @@ class DeliveryAddressesDB:
         if not os.path.exists(path):
             return DeliveryAddressesDB(DeliveryAddressesDB._copy_from_clients())
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            with open(path, "rb") as f:
+                data = json_loads(f.read())
             if isinstance(data, list):
                 recs = data
             else:
@@ -99,11 +101,13 @@ class DeliveryAddressesDB:
                 self.addresses.append(cur)
         else:
             self.addresses.append(addr)
+        self.version += 1
 
     def remove(self, name: str) -> bool:
         i = self._idx_by_name(name)
         if i >= 0:
             self.addresses.pop(i)
+            self.version += 1
             return True
         return False
 
@@ -111,6 +115,7 @@ class DeliveryAddressesDB:
         i = self._idx_by_name(name)
         if i >= 0:
             self.addresses[i].favorite = not self.addresses[i].favorite
+            self.version += 1
             return True
         return False
 
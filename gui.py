@@ -1241,12 +1241,8 @@ def start_gui():
                 return
             try:
                 df = read_csv_flex(path)
-                for rec in df.to_dict(orient="records"):
-                    try:
-                        sup = Supplier.from_any(rec)
-                        self.db.upsert(sup)
-                    except Exception:
-                        pass
+                for sup in Supplier.from_dataframe(df):
+                    self.db.upsert(sup)
                 self.db.save(SUPPLIERS_DB_FILE)
                 self.refresh()
                 if self.on_change:
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import datetime
+import json
 import locale
 import os
 import re
+import time
 from collections import defaultdict
 from dataclasses import dataclass
 from functools import lru_cache
@@ -12,11 +14,37 @@ from typing import Any, Dict, List
 
 from export_bundle import create_export_bundle as _create_export_bundle
 
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    orjson = None
+
 
 def _to_str(x: Any) -> str:
     return "" if x is None else str(x)
 
 
+def _to_clean_str(x: Any) -> str:
+    """``_to_str(x).strip()`` in één aanroep; tekst wordt niet opnieuw omgezet."""
+
+    if x is None:
+        return ""
+    if isinstance(x, str):
+        return x.strip()
+    return str(x).strip()
+
+
+def json_loads(data: bytes | str) -> Any:
+    """Parse JSON text or bytes, via ``orjson`` when it is installed."""
+
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except Exception:
+            pass  # bv. BOM of NaN: laat de standaardbibliotheek beslissen
+    return json.loads(data)
+
+
 @lru_cache()
 def favorite_marker() -> str:
     """Return the preferred marker for favorites (★ when supported)."""
@@ -119,19 +147,77 @@ def _index_sort_key(path: str) -> tuple[int, int, str]:
     return priority_group, depth_score, path.lower()
 
 
+# Laatst opgebouwde indexen per (bronmap, extensies), samen met de mtime van
+# elke doorlopen map. Een bestand toevoegen, verwijderen of hernoemen wijzigt
+# de mtime van zijn map, dus een ongewijzigde set mtimes betekent dezelfde
+# index zonder opnieuw te walken.
+_FILE_INDEX_CACHE: Dict[tuple, tuple[Dict[str, int], Dict[str, List[str]]]] = {}
+_FILE_INDEX_CACHE_SIZE = 8
+# Mappen die net gewijzigd zijn kunnen tijdens de walk nog veranderd zijn
+# binnen dezelfde mtime-tik; zo'n index wordt niet bewaard.
+_FILE_INDEX_SETTLE_NS = 2_000_000_000
+
+
+def _dir_mtimes_unchanged(dir_mtimes: Dict[str, int]) -> bool:
+    for path, mtime in dir_mtimes.items():
+        try:
+            if os.stat(path).st_mtime_ns != mtime:
+                return False
+        except OSError:
+            return False
+    return True
+
+
 def _build_file_index(source_folder: str, selected_exts: List[str]) -> Dict[str, List[str]]:
-    idx = defaultdict(list)
     sel = set(e.lower() for e in selected_exts)
+    cache_key = (os.path.abspath(source_folder), tuple(sorted(sel)))
+    cached = _FILE_INDEX_CACHE.get(cache_key)
+    if cached is not None and _dir_mtimes_unchanged(cached[0]):
+        return defaultdict(list, {key: list(paths) for key, paths in cached[1].items()})
+
+    idx = defaultdict(list)
+    dir_mtimes: Dict[str, int] = {}
+    cacheable = True
     for rootdir, _, files in os.walk(source_folder):
+        try:
+            dir_mtimes[rootdir] = os.stat(rootdir).st_mtime_ns
+        except OSError:
+            cacheable = False
         for f in files:
             name, ext = os.path.splitext(f)
             if ext.lower() in sel:
                 idx[name].append(os.path.join(rootdir, f))
     for key, paths in idx.items():
         paths.sort(key=_index_sort_key)
+
+    settled_before = time.time_ns() - _FILE_INDEX_SETTLE_NS
+    if cacheable and dir_mtimes and max(dir_mtimes.values()) < settled_before:
+        _FILE_INDEX_CACHE.pop(cache_key, None)
+        while len(_FILE_INDEX_CACHE) >= _FILE_INDEX_CACHE_SIZE:
+            _FILE_INDEX_CACHE.pop(next(iter(_FILE_INDEX_CACHE)))
+        _FILE_INDEX_CACHE[cache_key] = (
+            dir_mtimes,
+            {key: list(paths) for key, paths in idx.items()},
+        )
+    else:
+        _FILE_INDEX_CACHE.pop(cache_key, None)
     return idx
 
 
+def _normalize_file_index(idx: Dict[str, List[str]]) -> Dict[str, List[str]]:
+    """Re-key a :func:`_build_file_index` result on ``stem.strip().lower()``.
+
+    Lookups then only need the normalized PartNumber; stems differing in case
+    or surrounding whitespace share one (re-sorted) path list.
+    """
+    norm: Dict[str, List[str]] = defaultdict(list)
+    for key, paths in idx.items():
+        norm[key.strip().lower()].extend(paths)
+    for paths in norm.values():
+        paths.sort(key=_index_sort_key)
+    return dict(norm)
+
+
 def _unique_path(path: str) -> str:
     if not os.path.exists(path):
         return path
@@ -1,4 +1,5 @@
 from __future__ import annotations
+import multiprocessing
 import sys
 from typing import List, Optional
 
@@ -69,4 +70,6 @@ def main(argv: Optional[List[str]] = None) -> int:
 
 
 if __name__ == "__main__":
+    # Nodig voor de procespool (PDF-rendering) in de PyInstaller-build.
+    multiprocessing.freeze_support()
     sys.exit(main())
@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 import math
+import re
 import unicodedata
-from dataclasses import dataclass
+from functools import partial
 from typing import Callable, Dict, List, Optional, Tuple, TYPE_CHECKING
 
 import tkinter as tk
@@ -16,11 +17,28 @@ from orders import _prefix_for_doc_type, _sanitize_component
 if TYPE_CHECKING:
     from clients_db import ClientsDB
 
+_COMMA_DOT = str.maketrans({",": "."})
+_NUM_RE = re.compile(r"^[+-]?(?:\d+(?:\.\d*)?|\.\d+)$")
+
+
+def _sum_weights(texts: List[str]) -> Optional[float]:
+    """Sum a column of weight strings; ``None`` when no valid number is present."""
+
+    match = _NUM_RE.match
+    numbers = [
+        float(text)
+        for text in (raw.strip().translate(_COMMA_DOT) for raw in texts)
+        if text and match(text)
+    ]
+    if not numbers:
+        return None
+    return math.fsum(numbers)
+
 
 def _normalize_numeric(value: str) -> object:
     """Try to convert ``value`` to ``int``/``float`` while respecting decimals."""
 
-    text = value.strip().replace(",", ".")
+    text = value.strip().translate(_COMMA_DOT)
     if not text:
         return ""
     try:
@@ -86,12 +104,38 @@ def _format_currency(value: str) -> str:
     return integer_part
 
 
-@dataclass
 class _ManualRowWidgets:
-    frame: tk.Frame
-    vars: Dict[str, tk.StringVar]
-    entries: Dict[str, tk.Entry]
-    remove_btn: tk.Button
+    """Widgets and values of one manual row.
+
+    ``vars`` is a tuple in the order of ``ManualOrderTab.current_columns``;
+    use ``ManualOrderTab._key_index`` to find the position of a column key.
+    """
+
+    __slots__ = (
+        "frame",
+        "vars",
+        "entries",
+        "remove_btn",
+        "separators",
+        "applied_widths",
+        "traces",
+    )
+
+    def __init__(
+        self,
+        frame: Optional[tk.Frame],
+        vars: Tuple[tk.StringVar, ...],
+        entries: Dict[str, tk.Entry],
+        remove_btn: Optional[tk.Button],
+    ) -> None:
+        self.frame = frame
+        self.vars = vars
+        self.entries = entries
+        self.remove_btn = remove_btn
+        self.separators: List[tk.Frame] = []
+        self.applied_widths: Dict[str, int] = {}
+        # (Tcl-variabelenaam, trace-commando) voor gewicht- en prijsvelden
+        self.traces: List[Tuple[str, str]] = []
 
 
 DEFAULT_MANUAL_CONTEXT = "Bestelbon-editor"
@@ -601,6 +645,7 @@ class ManualOrderTab(tk.Frame):
     }
 
     QUANTITY_KEY_HINTS = {"aantal", "st", "st.", "qty", "quantity", "stuks"}
+    PRICE_KEYS = frozenset({"Eenheidsprijs", "Totaalprijs"})
 
     DOC_TYPE_OPTIONS: tuple[str, ...] = ("Bestelbon", "Standaard bon", "Offerteaanvraag")
     DELIVERY_PRESETS: tuple[str, ...] = (
@@ -989,6 +1034,9 @@ class ManualOrderTab(tk.Frame):
             (0, 0), window=self.rows_frame, anchor="nw"
         )
         self.rows_frame.columnconfigure(1, weight=1)
+        # Directe Tcl-aanroep voor de vele grid-kolominstellingen (zonder kwargs-parsing)
+        self._grid_cc = self.rows_frame.tk.call
+        self._rf_w = self.rows_frame._w
         
         # Initialiseer kolom-resize handles lijst
         self._column_resizer_handles = []
@@ -1074,6 +1122,15 @@ class ManualOrderTab(tk.Frame):
         self._column_resize_state: Optional[Dict[str, object]] = None
         self._resizer_update_job: Optional[str] = None
         self._row_grid_indices: Dict[int, int] = {}  # Maps rows-list index to grid row number
+        self._frame_to_row: Dict[str, _ManualRowWidgets] = {}
+        # Hergebruikte StringVars van verwijderde rijen (bespaart Tcl-variabelen)
+        self._stringvar_pool: List[tk.StringVar] = []
+        self._key_index: Dict[str, int] = {}
+        # (display_chars, min_width_px) per id() van de kolomdefinitie
+        self._metrics_cache: Dict[int, Tuple[int, int]] = {}
+        self._last_delivery_version: Optional[Tuple[int, int]] = None
+        self._last_delivery_opts: List[str] = []
+        self._var_trace_cmds = self._register_var_trace_handlers()
 
         # Maak EERST de header-rij IN de canvas (voor alle andere inits!)
         self._create_header_row_in_canvas()
@@ -1120,14 +1177,26 @@ class ManualOrderTab(tk.Frame):
         if current_supplier not in supplier_opts:
             self.supplier_var.set("Geen")
 
-        delivery_opts = list(self.DELIVERY_PRESETS)
-        if self.delivery_db is not None:
-            delivery_opts.extend(
-                self.delivery_db.display_name(a)
-                for a in self.delivery_db.addresses_sorted()
-            )
+        # Alleen herbouwen wanneer de leveradressen sinds de vorige keer wijzigden
+        delivery_version = getattr(self.delivery_db, "version", None)
+        version_key = (
+            (id(self.delivery_db), delivery_version)
+            if delivery_version is not None
+            else None
+        )
+        if version_key is None or version_key != self._last_delivery_version:
+            delivery_opts = list(self.DELIVERY_PRESETS)
+            if self.delivery_db is not None:
+                delivery_opts.extend(
+                    self.delivery_db.display_name(a)
+                    for a in self.delivery_db.addresses_sorted()
+                )
+            self.delivery_combo.configure(values=delivery_opts)
+            self._last_delivery_version = version_key
+            self._last_delivery_opts = delivery_opts
+        else:
+            delivery_opts = self._last_delivery_opts
         current_delivery = self.delivery_var.get()
-        self.delivery_combo.configure(values=delivery_opts)
         if current_delivery not in delivery_opts:
             self.delivery_var.set(self.DELIVERY_PRESETS[0])
 
@@ -1164,116 +1233,179 @@ class ManualOrderTab(tk.Frame):
         self._next_data_row = 1
     
     def add_row(self, values: Optional[Dict[str, object]] = None) -> None:
-        # Maak een button-frame voor delete/copy/add knoppen
-        buttons_frame = tk.Frame(self.rows_frame)
+        widgets = self._append_row_data(values)
+        self._mount_row_widgets(widgets, self._row_grid_indices[len(self.rows) - 1])
+        self._focus_row(widgets)
+        self._update_totals()
+
+    def _append_row_data(
+        self, values: Optional[Dict[str, object]] = None
+    ) -> _ManualRowWidgets:
+        """Register a data row (StringVars only); widgets are mounted later."""
+
         row_idx = self._next_data_row
-        buttons_frame.grid(row=row_idx, column=0, sticky="w")
-        
         # Bepaal de rij-index in self.rows (dit is de lengte voordat we toevoegen)
         row_list_idx = len(self.rows)
-        
-        # Delete-knop met correct index
-        remove_btn = tk.Button(
-            buttons_frame,
-            text="✕",
-            width=2,
-            bg="#ff6b6b",
-            fg="white",
-            command=lambda idx=row_list_idx: self._safe_delete_row(idx),
+        pool = self._stringvar_pool
+        row_vars: List[tk.StringVar] = []
+        traces: List[Tuple[str, str]] = []
+        for column in self.current_columns:
+            var = pool.pop() if pool else tk.StringVar()
+            key = column["key"]
+            is_price = key in self.PRICE_KEYS
+            if values is not None and key in values:
+                value = values[key]
+                text = "" if value is None else str(value)
+                var.set(_format_currency(text) if is_price else text)
+            # Trace pas na het vullen: bulk-invoer herberekent het totaal één keer
+            if column.get("total_weight"):
+                traces.append(self._add_var_trace(var, "weight"))
+            elif is_price:
+                traces.append(self._add_var_trace(var, "price"))
+            row_vars.append(var)
+        widgets = _ManualRowWidgets(
+            frame=None, vars=tuple(row_vars), entries={}, remove_btn=None
         )
-        remove_btn.pack(side="left", padx=(0, 2))
+        widgets.traces = traces
+
+        self.rows.append(widgets)
+        self._row_grid_indices[row_list_idx] = row_idx  # Track grid row voor deze data row
+        self._next_data_row += 1
+        return widgets
+
+    def _mount_row_widgets(self, widgets: _ManualRowWidgets, row_idx: int) -> None:
+        """Create the buttons, entries and separators for a registered row."""
+
+        # Maak een button-frame voor delete/copy/add knoppen
+        buttons_frame = tk.Frame(self.rows_frame)
+        buttons_frame.grid(row=row_idx, column=0, sticky="w")
         
-        # Copy-knop met correct index
-        copy_btn = tk.Button(
-            buttons_frame,
-            text="⧉",
-            width=2,
-            bg="#4ecdc4",
-            fg="white",
-            command=lambda idx=row_list_idx: self._copy_row(idx),
-        )
+        # Knoppen delen één handler per actie; de rij wordt pas bij het
+        # klikken opgezocht zodat indices na verwijderen niet verouderen.
+        remove_btn = self._make_row_button(buttons_frame, "remove", text="✕", bg="#ff6b6b")
+        remove_btn.pack(side="left", padx=(0, 2))
+        copy_btn = self._make_row_button(buttons_frame, "copy", text="⧉", bg="#4ecdc4")
         copy_btn.pack(side="left", padx=(0, 2))
-        
-        # Add-knop (nieuwe rij toevoegen)
-        add_btn = tk.Button(
-            buttons_frame,
-            text="+",
-            width=2,
-            bg="#51cf66",
-            fg="white",
-            command=lambda: self.add_row(),
-        )
+        add_btn = self._make_row_button(buttons_frame, "add", text="+", bg="#51cf66")
         add_btn.pack(side="left", padx=(0, 0))
-        
-        # Data entries en separators direkt in rows_frame (GEEN nested frame!)
-        widgets = _ManualRowWidgets(
-            frame=buttons_frame,  # Store the button frame
-            vars={},
-            entries={},
-            remove_btn=remove_btn,
-        )
+        widgets.frame = buttons_frame
+        widgets.remove_btn = remove_btn
 
-        for idx, column in enumerate(self.current_columns):
+        # Data entries en separators direkt in rows_frame (GEEN nested frame!)
+        rows_frame = self.rows_frame
+        columnconfigure = self._grid_columnconfigure
+        current_columns = tuple(self.current_columns)
+        last_idx = len(current_columns) - 1
+        for idx, column in enumerate(current_columns):
             grid_col = 1 + idx * 2  # Kolom 1, 3, 5, 7, ...
             
-            # Create entry widget
-            var = tk.StringVar()
-            if values is not None and column["key"] in values:
-                value = values[column["key"]]
-                var.set("" if value is None else str(value))
-            
             display_chars, min_width_px = self._column_display_metrics(column)
             entry = tk.Entry(
-                self.rows_frame,
-                textvariable=var,
+                rows_frame,
+                textvariable=widgets.vars[idx],
                 width=display_chars,
                 justify=column.get("justify", "left"),
             )
             entry.grid(row=row_idx, column=grid_col, sticky="ew", padx=(6, 6))
+            widgets.applied_widths[column["key"]] = display_chars
             
             # Configure column width
             if column.get("stretch"):
                 weight = 1
             else:
                 weight = 0
-            self.rows_frame.columnconfigure(grid_col, weight=weight, minsize=min_width_px)
+            columnconfigure(grid_col, weight, min_width_px)
             
             # Add separator BETWEEN columns (not after last)
-            if idx < len(self.current_columns) - 1:
+            if idx < last_idx:
                 sep_col = grid_col + 1  # Kolom 2, 4, 6, 8, ...
                 separator = tk.Frame(
-                    self.rows_frame,
+                    rows_frame,
                     width=2,
                     background=self.COLUMN_SEPARATOR_COLOR,
                 )
                 separator.grid(row=row_idx, column=sep_col, sticky="ns", padx=0)
-                self.rows_frame.columnconfigure(sep_col, weight=0, minsize=2)
-            
-            # Add tracing for currency formatting on price fields
-            is_price_field = column["key"] in {"Eenheidsprijs", "Totaalprijs"}
+                columnconfigure(sep_col, 0, 2)
+                widgets.separators.append(separator)
             
-            def _on_var_change(*_args, key=column["key"], is_price=is_price_field, v=var):
-                # Apply currency formatting for price fields
-                if is_price:
-                    current = v.get()
-                    formatted = _format_currency(current)
-                    if formatted != current:
-                        v.set(formatted)
-                self._update_totals()
-            
-            var.trace_add("write", _on_var_change)
-            widgets.vars[column["key"]] = var
             widgets.entries[column["key"]] = entry
-        
-        self.rows.append(widgets)
-        self._row_grid_indices[row_list_idx] = row_idx  # Track grid row voor deze data row
-        self._next_data_row += 1
-        
-        if self.current_columns:
-            first_key = self.current_columns[0]["key"]
-            self.after_idle(lambda: widgets.entries[first_key].focus_set())
+
+        self._frame_to_row[str(buttons_frame)] = widgets
+
+    def _mount_pending_rows(self) -> None:
+        """Mount widgets for every row that only has its data registered."""
+
+        last_mounted: Optional[_ManualRowWidgets] = None
+        for list_idx, widgets in enumerate(self.rows):
+            if widgets.frame is not None:
+                continue
+            self._mount_row_widgets(widgets, self._row_grid_indices[list_idx])
+            last_mounted = widgets
+        if last_mounted is not None:
+            self._focus_row(last_mounted)
+
+    def _focus_row(self, widgets: _ManualRowWidgets) -> None:
+        if not self.current_columns:
+            return
+        entry = widgets.entries.get(self.current_columns[0]["key"])
+        if entry is not None:
+            self.after_idle(entry.focus_set)
+
+    def _register_var_trace_handlers(self) -> Dict[str, str]:
+        """Register one shared Tcl command per trace kind (weight, price)."""
+
+        return {
+            "weight": self.register(self._on_weight_var_write),
+            "price": self.register(self._on_price_var_write),
+        }
+
+    def _add_var_trace(self, var: tk.StringVar, kind: str) -> Tuple[str, str]:
+        """Attach the shared ``kind`` write trace to ``var``."""
+
+        # Rechtstreeks via Tcl: var.trace_add zou per variabele een nieuw
+        # Tcl-commando registreren.
+        name = str(var)
+        command = self._var_trace_cmds[kind]
+        self.tk.call("trace", "add", "variable", name, "write", command)
+        return name, command
+
+    def _on_weight_var_write(self, _name: str, _index: str, _mode: str) -> None:
         self._update_totals()
 
+    def _on_price_var_write(self, name: str, _index: str, _mode: str) -> None:
+        current = str(self.tk.globalgetvar(name))
+        formatted = _format_currency(current)
+        if formatted != current:
+            self.tk.globalsetvar(name, formatted)
+
+    def _make_row_button(self, parent: tk.Misc, action: str, **options) -> tk.Button:
+        return tk.Button(
+            parent,
+            width=2,
+            fg="white",
+            command=partial(self._on_row_action, action, parent),
+            **options,
+        )
+
+    def _on_row_action(self, action: str, buttons_frame: tk.Misc) -> None:
+        """Shared handler for the remove/copy/add buttons of a row."""
+
+        if action == "add":
+            self.add_row()
+            return
+        # De rij pas bij het klikken opzoeken: indices verschuiven na verwijderen
+        row = self._frame_to_row.get(str(buttons_frame))
+        if row is None:
+            return
+        try:
+            row_idx = self.rows.index(row)
+        except ValueError:
+            return
+        if action == "remove":
+            self._safe_delete_row(row_idx)
+        else:
+            self._copy_row(row_idx)
+
     def remove_row(self, row_idx: int) -> None:
         """Remove a data row by its index in self.rows."""
         if not (0 <= row_idx < len(self.rows)):
@@ -1281,6 +1413,7 @@ class ManualOrderTab(tk.Frame):
         
         row = self.rows[row_idx]
         self.rows.pop(row_idx)
+        self._frame_to_row.pop(str(row.frame), None)
         
         # Destroy button frame
         try:
@@ -1289,15 +1422,21 @@ class ManualOrderTab(tk.Frame):
         except Exception:
             pass
         
-        # Destroy all entry widgets in this row
-        for entry in row.entries.values():
+        # Destroy all entry widgets and separators in this row
+        for widget in (*row.entries.values(), *row.separators):
             try:
-                entry.destroy()
+                widget.destroy()
             except Exception:
                 pass
+        self._release_row_vars(row)
         
-        # Remove grid row tracking
-        grid_row = self._row_grid_indices.pop(row_idx, None)
+        # Remove grid row tracking and shift the rows after it
+        grid_rows = [
+            grid_row
+            for list_idx, grid_row in sorted(self._row_grid_indices.items())
+            if list_idx != row_idx
+        ]
+        self._row_grid_indices = dict(enumerate(grid_rows))
         
         # Ensure at least one empty row exists
         if len(self.rows) == 0:
@@ -1335,9 +1474,7 @@ class ManualOrderTab(tk.Frame):
         
         # Get values from source row
         source_row = self.rows[row_idx]
-        source_values = {}
-        for key, var in source_row.vars.items():
-            source_values[key] = var.get()
+        source_values = self._row_values(source_row)
         
         # Add new row with same values
         self.add_row(values=source_values)
@@ -1351,56 +1488,54 @@ class ManualOrderTab(tk.Frame):
             desired = 1
         desired = max(1, min(desired, 500))
         for _ in range(desired):
-            self.add_row()
+            self._append_row_data()
+        self.after_idle(self._mount_pending_rows)
+        self._update_totals()
 
     # Data collection ------------------------------------------------
     def _collect_items(self) -> Dict[str, object]:
         items: List[Dict[str, object]] = []
-        total_weight = 0.0
-        weight_found = False
-        numeric_keys = {col["key"] for col in self.current_columns if col.get("numeric")}
-        weight_columns = [col["key"] for col in self.current_columns if col.get("total_weight")]
-        column_usage = {
-            col.get("key"): False
-            for col in self.current_columns
-            if col.get("key")
-        }
+        weight_texts: List[str] = []
+        columns = tuple(self.current_columns)
+        # Per kolom vooraf bepalen: (key, numeriek?, aantal-kolom?)
+        column_plan = tuple(
+            (
+                col["key"],
+                bool(col.get("numeric")),
+                bool(col.get("numeric")) and self._is_quantity_key(col["key"]),
+            )
+            for col in columns
+        )
+        weight_pos = next(
+            (idx for idx, col in enumerate(columns) if col.get("total_weight")), None
+        )
+        column_usage = {col.get("key"): False for col in columns if col.get("key")}
+        normalize = _normalize_numeric
+        ensure_integer = _ensure_integer_quantity
+        append_item = items.append
 
         for widgets in self.rows:
-            raw = {key: var.get().strip() for key, var in widgets.vars.items()}
-            if not any(raw.values()):
+            raw = [var.get().strip() for var in widgets.vars]
+            if not any(raw):
                 continue
             record: Dict[str, object] = {}
-            for column in self.current_columns:
-                key = column["key"]
-                value = raw.get(key, "")
-                if key in column_usage and value:
+            for value, (key, is_numeric, is_quantity) in zip(raw, column_plan):
+                if value and key in column_usage:
                     column_usage[key] = True
-                if key in numeric_keys:
-                    normalized = _normalize_numeric(value)
-                    if self._is_quantity_key(key):
-                        normalized = _ensure_integer_quantity(normalized)
+                if is_numeric:
+                    normalized = normalize(value)
+                    if is_quantity:
+                        normalized = ensure_integer(normalized)
                 else:
                     normalized = value
                 record[key] = normalized
-            if weight_columns:
-                weight_key = weight_columns[0]
-                weight_raw = raw.get(weight_key, "")
-            else:
-                weight_raw = ""
-            if weight_raw:
-                try:
-                    weight_total = float(weight_raw.replace(",", "."))
-                except Exception:
-                    weight_total = None
-                if weight_total is not None and math.isfinite(weight_total):
-                    total_weight += weight_total
-                    weight_found = True
-            items.append(record)
+            if weight_pos is not None:
+                weight_texts.append(raw[weight_pos])
+            append_item(record)
 
         return {
             "items": items,
-            "total_weight": total_weight if weight_found else None,
+            "total_weight": _sum_weights(weight_texts),
             "used_columns": {key for key, used in column_usage.items() if used},
         }
 
@@ -1463,14 +1598,28 @@ class ManualOrderTab(tk.Frame):
 
     # Internal -------------------------------------------------------
     def _update_totals(self) -> None:
-        payload = self._collect_items()
-        total_weight = payload["total_weight"]
+        total_weight = self._total_weight()
         if total_weight is None:
             text = "Totaal gewicht: —"
         else:
             text = f"Totaal gewicht: {total_weight:.2f} kg"
         self.total_weight_var.set(text)
 
+    def _total_weight(self) -> Optional[float]:
+        """Sum the weight column without collecting the other cells."""
+
+        weight_pos = next(
+            (
+                idx
+                for idx, col in enumerate(self.current_columns)
+                if col.get("total_weight")
+            ),
+            None,
+        )
+        if weight_pos is None:
+            return None
+        return _sum_weights([widgets.vars[weight_pos].get() for widgets in self.rows])
+
     def _clone_columns(self, template: str) -> List[Dict[str, object]]:
         columns = self.COLUMN_TEMPLATES.get(template, [])
         cloned = [dict(col) for col in columns]
@@ -1529,19 +1678,27 @@ class ManualOrderTab(tk.Frame):
         # Don't enforce header width as minimum - let columns be smaller than their headers
         # The header text will just wrap or be cut off if needed
         column["_min_width_px"] = min_width_px
+        metrics_cache = getattr(self, "_metrics_cache", None)
+        if metrics_cache is not None:
+            metrics_cache[id(column)] = (display_chars, min_width_px)
 
     def _column_display_metrics(self, column: Dict[str, object]) -> tuple[int, int]:
         """Return the preferred width in characters and pixels for a column."""
 
+        cached = self._metrics_cache.get(id(column))
+        if cached is not None:
+            return cached
         if "_display_chars" not in column or "_min_width_px" not in column:
             self._ensure_column_metrics(column)
         return column["_display_chars"], column["_min_width_px"]
 
     def _capture_rows(self) -> List[Dict[str, str]]:
-        captured: List[Dict[str, str]] = []
-        for widgets in self.rows:
-            captured.append({key: var.get() for key, var in widgets.vars.items()})
-        return captured
+        return [self._row_values(widgets) for widgets in self.rows]
+
+    def _row_values(self, widgets: _ManualRowWidgets) -> Dict[str, str]:
+        return {
+            key: widgets.vars[pos].get() for key, pos in self._key_index.items()
+        }
 
     def _clear_rows(self) -> None:
         # Destroy all data row widgets
@@ -1553,92 +1710,102 @@ class ManualOrderTab(tk.Frame):
             except Exception:
                 pass
             
-            # Also destroy all entry widgets directly
-            for entry in widgets.entries.values():
+            # Also destroy all entry widgets and separators directly
+            for widget in (*widgets.entries.values(), *widgets.separators):
                 try:
-                    entry.destroy()
+                    widget.destroy()
                 except Exception:
                     pass
+            self._release_row_vars(widgets)
         
         self.rows.clear()
+        self._frame_to_row.clear()
         self._row_grid_indices.clear()
         self._next_data_row = 1  # Reset naar rij 1 (header is rij 0)
 
+    def _release_row_vars(self, widgets: _ManualRowWidgets) -> None:
+        """Return a row's StringVars to the pool for reuse by new rows."""
+
+        for name, command in widgets.traces:
+            self.tk.call("trace", "remove", "variable", name, "write", command)
+        widgets.traces = []
+        for var in widgets.vars:
+            var.set("")
+            self._stringvar_pool.append(var)
+
     def _render_header(self) -> None:
-        """Render header-labels en separators direkt in rows_frame rij 0."""
-        # Clear old header widgets
-        for lbl in self._header_labels.values():
+        """Render header-labels en separators direkt in rows_frame rij 0.
+
+        Bestaande labels en separators worden hergebruikt (tekst en grid
+        bijwerken) in plaats van bij elke sjabloonwissel opnieuw gemaakt;
+        enkel overtollige widgets worden vernietigd.
+        """
+        column_count = len(self.current_columns)
+        separator_count = max(0, column_count - 1)
+
+        # Overtollige header-labels opruimen
+        for idx in [i for i in self._header_labels if i >= column_count]:
             try:
-                lbl.destroy()
+                self._header_labels.pop(idx).destroy()
             except Exception:
                 pass
-        self._header_labels.clear()
-        
-        for sep in self._header_separators:
+
+        # Separators zijn tegelijk de resize-handles (één widget per scheiding)
+        while len(self._header_separators) > separator_count:
+            sep = self._header_separators.pop()
             try:
                 sep.destroy()
             except Exception:
                 pass
-        self._header_separators.clear()
-        
-        # Verwijder oude resize-handles
-        for handle in self._column_resizer_handles:
-            try:
-                handle.destroy()
-            except Exception:
-                pass
-        self._column_resizer_handles.clear()
+        self._column_resizer_handles = list(self._header_separators)
         
-        # IMPORTANT: Clear ALL grid column configurations from rows_frame
-        # This prevents old columns from showing up when switching templates
-        for col in list(self.rows_frame.grid_slaves()):
-            try:
-                col.grid_remove()
-            except Exception:
-                pass
+        # Data rows (entries + separators) are destroyed by _clear_rows and
+        # header widgets above, so no sweep over grid_slaves() is needed.
         
         # Reset all grid column weights and sizes
-        for col_idx in range(100):  # Clear up to column 100
-            try:
-                self.rows_frame.columnconfigure(col_idx, weight=0, minsize=0)
-            except Exception:
-                pass
+        try:  # Clear up to column 100 in één Tcl-aanroep
+            self._grid_columnconfigure(tuple(range(100)), 0, 0)
+        except Exception:
+            pass
         
         # Render header-labels EN separators direkt in rows_frame grid
+        header_font = getattr(self, "_header_font", None) or ("TkDefaultFont", 10, "bold")
         for idx, column in enumerate(self.current_columns):
             grid_col = 1 + idx * 2  # Grid kolom 1, 3, 5, 7, ...
             display_chars, min_width_px = self._column_display_metrics(column)
+            text = column.get("label", column.get("key", ""))
 
             # Header label
-            lbl = tk.Label(
-                self.rows_frame,
-                text=column.get("label", column.get("key", "")),
-                anchor="w",
-                font=getattr(self, "_header_font", None) or ("TkDefaultFont", 10, "bold"),
-            )
+            lbl = self._header_labels.get(idx)
+            if lbl is None:
+                lbl = tk.Label(self.rows_frame, text=text, anchor="w", font=header_font)
+                self._header_labels[idx] = lbl
+            else:
+                lbl.configure(text=text)
             lbl.grid(row=0, column=grid_col, sticky="ew", padx=(6, 6))
-            self.rows_frame.columnconfigure(grid_col, weight=1 if column.get("stretch") else 0, minsize=min_width_px)
-            self._header_labels[idx] = lbl
+            self._grid_columnconfigure(grid_col, 1 if column.get("stretch") else 0, min_width_px)
             self._configure_header_label(lbl, display_chars, min_width_px)
             
             # Separator TUSSEN kolommen
-            if idx < len(self.current_columns) - 1:
+            if idx < separator_count:
                 sep_col = grid_col + 1  # Grid kolom 2, 4, 6, 8, ...
-                separator = tk.Frame(
-                    self.rows_frame,
-                    width=2,
-                    background=self.COLUMN_SEPARATOR_COLOR,
-                    cursor="sb_h_double_arrow",
-                )
+                if idx < len(self._header_separators):
+                    # Bindings verwijzen al naar deze kolomindex
+                    separator = self._header_separators[idx]
+                else:
+                    separator = tk.Frame(
+                        self.rows_frame,
+                        width=2,
+                        background=self.COLUMN_SEPARATOR_COLOR,
+                        cursor="sb_h_double_arrow",
+                    )
+                    # Bind resize events with correct column_index
+                    # Use a helper function to create proper closures
+                    self._bind_separator_events(separator, idx)
+                    self._header_separators.append(separator)
+                    self._column_resizer_handles.append(separator)
                 separator.grid(row=0, column=sep_col, sticky="ns", padx=0)
-                self.rows_frame.columnconfigure(sep_col, weight=0, minsize=2)
-                
-                # Bind resize events with correct column_index
-                # Use a helper function to create proper closures
-                self._bind_separator_events(separator, idx)
-                
-                self._column_resizer_handles.append(separator)
-                self._header_separators.append(separator)
+                self._grid_columnconfigure(sep_col, 0, 2)
         
         self._schedule_resizer_position_update()
     
@@ -1760,13 +1927,15 @@ class ManualOrderTab(tk.Frame):
             return None
         return handle
 
+    RESIZER_UPDATE_DELAY_MS = 16  # ~60 Hz tijdens het slepen
+
     def _schedule_resizer_position_update(self) -> None:
+        # Reeds gepland: laat die ene update alle tussenliggende events opvangen
         if self._resizer_update_job is not None:
-            try:
-                self.after_cancel(self._resizer_update_job)
-            except Exception:
-                pass
-        self._resizer_update_job = self.after_idle(self._update_resizer_positions)
+            return
+        self._resizer_update_job = self.after(
+            self.RESIZER_UPDATE_DELAY_MS, self._update_resizer_positions
+        )
 
     def _update_resizer_positions(self) -> None:
         self._resizer_update_job = None
@@ -1806,6 +1975,8 @@ class ManualOrderTab(tk.Frame):
 
     def _apply_template(self, template: str, *, store_previous: bool = True) -> None:
         self.current_template_name = template
+        # Oude kolomdicts verdwijnen; hun id() kan hergebruikt worden
+        self._metrics_cache.clear()
         if template in self._template_layout_cache:
             cached_layout = [dict(col) for col in self._template_layout_cache[template]]
             for column in cached_layout:
@@ -1816,6 +1987,9 @@ class ManualOrderTab(tk.Frame):
         if not self.current_columns:
             self.current_columns = self._clone_columns(self.DEFAULT_TEMPLATE)
             self.current_template_name = self.DEFAULT_TEMPLATE
+        self._key_index = {
+            column["key"]: pos for pos, column in enumerate(self.current_columns)
+        }
 
         # Clear rows BEFORE rendering header (so grid columns are reset)
         self._clear_rows()
@@ -1834,8 +2008,11 @@ class ManualOrderTab(tk.Frame):
         # Clamp desired width between global min/max
         # Allow columns to be smaller than their header text
         desired = max(self.COLUMN_MIN_CHARS, min(self.COLUMN_MAX_CHARS, desired_chars))
+        if column.get("width") == desired:
+            return
         
         column["width"] = desired
+        self._metrics_cache.pop(id(column), None)
         column.pop("_display_chars", None)
         column.pop("_min_width_px", None)
         self._ensure_column_metrics(column)
@@ -1849,25 +2026,44 @@ class ManualOrderTab(tk.Frame):
 
         # Grid column is 1 + column_index * 2
         grid_col = 1 + column_index * 2
-        self.rows_frame.columnconfigure(grid_col, weight=weight, minsize=min_width_px)
+        self._grid_columnconfigure(grid_col, weight, min_width_px)
 
         header_lbl = self._header_labels.get(column_index)
         if header_lbl is not None and header_lbl.winfo_exists():
             self._configure_header_label(header_lbl, display_chars, min_width_px)
 
-        # Update all data rows
+        # Alle gemounte rijen bijwerken: grid neemt de grootste gevraagde
+        # breedte van de kolom, dus één verouderde entry houdt ze breed.
+        # Entries die de breedte al hebben worden overgeslagen.
         key = column.get("key")
         for widgets in self.rows:
-            entry = widgets.entries.get(key)
-            if entry is None:
-                continue
-            try:
-                entry.configure(width=display_chars)
-            except Exception:
-                pass
+            self._apply_entry_width(widgets, key, display_chars)
 
         self._schedule_resizer_position_update()
 
+    def _apply_entry_width(
+        self, widgets: _ManualRowWidgets, key: object, display_chars: int
+    ) -> None:
+        entry = widgets.entries.get(key)
+        if entry is None or widgets.applied_widths.get(key) == display_chars:
+            return
+        try:
+            entry.configure(width=display_chars)
+        except Exception:
+            return
+        widgets.applied_widths[key] = display_chars
+
+    def _grid_columnconfigure(self, column, weight: int, minsize: int) -> None:
+        """``rows_frame.columnconfigure`` via a pre-bound Tcl call.
+
+        ``column`` may be a single index or a tuple of indices.
+        """
+
+        self._grid_cc(
+            "grid", "columnconfigure", self._rf_w, column,
+            "-weight", weight, "-minsize", minsize,
+        )
+
     def _configure_header_label(
         self, label: tk.Widget, display_chars: int, min_width_px: int
     ) -> None:
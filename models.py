@@ -1,10 +1,316 @@
+import re
+import sys
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
 
 from helpers import _to_str
 
 
-@dataclass
+def _interned_map(raw: Dict[str, str]) -> "MappingProxyType[str, str]":
+    """Freeze ``raw`` with interned canonical names (pointer-equal dict keys)."""
+
+    return MappingProxyType({key: sys.intern(value) for key, value in raw.items()})
+
+
+# Kolomnamen uit CSV/JSON (lowercase) -> canonical veldnaam
+_SUPPLIER_KEY_MAP = _interned_map({
+    # naam & beschrijving
+    "supplier": "supplier",
+    "leverancier": "supplier",
+    "supplier name": "supplier",
+    "naam": "supplier",
+    "description": "description",
+    "beschrijving": "description",
+    "omschrijving": "description",
+    "notes": "description",
+    # id
+    "supplier_id": "supplier_id",
+    "supplier id": "supplier_id",
+    "id": "supplier_id",
+    # adres 1
+    "adres_1": "adres_1",
+    "adres 1": "adres_1",
+    "adres1": "adres_1",
+    "address_1": "adres_1",
+    "address 1": "adres_1",
+    "address": "adres_1",
+    "adress_1": "adres_1",
+    "adress 1": "adres_1",
+    "adress1": "adres_1",
+    "straat": "adres_1",
+    # adres 2
+    "adres_2": "adres_2",
+    "adres 2": "adres_2",
+    "adres2": "adres_2",
+    "address_2": "adres_2",
+    "address 2": "adres_2",
+    "adress_2": "adres_2",
+    "adress 2": "adres_2",
+    "adress2": "adres_2",
+    # postcode
+    "postcode": "postcode",
+    "postal code": "postcode",
+    "zip": "postcode",
+    "zip code": "postcode",
+    # gemeente / stad / city / plaats
+    "gemeente": "gemeente",
+    "stad": "gemeente",
+    "city": "gemeente",
+    "plaats": "gemeente",
+    "town": "gemeente",
+    # land
+    "land": "land",
+    "country": "land",
+    # btw (veel varianten)
+    "btw": "btw",
+    "vat": "btw",
+    "btw nummer": "btw",
+    "btw-nummer": "btw",
+    "btw number": "btw",
+    "vat number": "btw",
+    "btw number:": "btw",
+    "btw nr": "btw",
+    "btw nr.": "btw",
+    "btw-nr": "btw",
+    "btw-nr.": "btw",
+    "btw no": "btw",
+    "btw no.": "btw",
+    "vat no": "btw",
+    "vat no.": "btw",
+    "vat id": "btw",
+    "vat identification number": "btw",
+    "vat reg": "btw",
+    "vat reg.": "btw",
+    "vat reg number": "btw",
+    # contact
+    "contact sales": "contact_sales",
+    "contact_sales": "contact_sales",
+    "sales contact": "contact_sales",
+    "sales_contact": "contact_sales",
+    # email
+    "sales e-mail": "sales_email",
+    "sales email": "sales_email",
+    "e-mail sales": "sales_email",
+    "email sales": "sales_email",
+    "sales_email": "sales_email",
+    "email": "sales_email",
+    "mail": "sales_email",
+    # phone
+    "phone": "phone",
+    "phone number": "phone",
+    "telefoon": "phone",
+    "telefoon nummer": "phone",
+    "tel": "phone",
+    "tel. sales": "phone",
+    "tel sales": "phone",
+    # product type en description
+    "product / product type": "product_type",
+    "product/product type": "product_type",
+    "product type": "product_type",
+    "producttype": "product_type",
+    "product_type": "product_type",
+    "category": "product_type",
+    "categorie": "product_type",
+    # favorite
+    "favorite": "favorite",
+    "favoriet": "favorite",
+    "fav": "favorite",
+})
+
+_CLIENT_KEY_MAP = _interned_map({
+    "name": "name",
+    "client": "name",
+    "opdrachtgever": "name",
+    "address": "address",
+    "adres": "address",
+    "btw": "vat",
+    "vat": "vat",
+    "btw nummer": "vat",
+    "btw-nummer": "vat",
+    "email": "email",
+    "e-mail": "email",
+    "mail": "email",
+    "favorite": "favorite",
+    "favoriet": "favorite",
+    "fav": "favorite",
+    "logo": "logo_path",
+    "logo_path": "logo_path",
+    "logo file": "logo_path",
+    "logo_file": "logo_path",
+    "logo crop": "logo_crop",
+    "logo_crop": "logo_crop",
+})
+
+_DELIVERY_KEY_MAP = _interned_map({
+    "name": "name",
+    "naam": "name",
+    "address": "address",
+    "adres": "address",
+    "remarks": "remarks",
+    "opmerking": "remarks",
+    "opmerkingen": "remarks",
+    "favorite": "favorite",
+    "favoriet": "favorite",
+    "fav": "favorite",
+})
+
+# Optionele tekstvelden die from_any via _clean overneemt
+_SUPPLIER_TEXT_FIELDS = (
+    "description",
+    "supplier_id",
+    "adres_1",
+    "adres_2",
+    "postcode",
+    "gemeente",
+    "land",
+    "btw",
+    "contact_sales",
+    "sales_email",
+    "phone",
+    "product_type",
+)
+_CLIENT_TEXT_FIELDS = ("address", "vat", "email")
+_DELIVERY_TEXT_FIELDS = ("address", "remarks")
+
+_KEY_MAPS = {
+    "supplier": _SUPPLIER_KEY_MAP,
+    "client": _CLIENT_KEY_MAP,
+    "delivery": _DELIVERY_KEY_MAP,
+}
+
+
+@lru_cache(maxsize=4096, typed=True)
+def _canonical_key(key: Any, which: str) -> Optional[str]:
+    """Return the canonical field for a raw column name (cached per header)."""
+
+    return _KEY_MAPS[which].get(str(key).strip().lower())
+
+
+_MISSING = object()
+_CROP_SPLIT = re.compile(r"[;,]")
+
+# Tekstwaarden die als "favoriet = ja" gelden
+_TRUTHY = frozenset({"1", "true", "yes", "y", "ja", "on", "waar"})
+
+
+def _clean(norm: Dict[str, Any], key: str) -> Optional[str]:
+    """Return the stripped text for ``key`` or ``None`` when absent/blank."""
+
+    value = norm.get(key, _MISSING)
+    if value is _MISSING or value is None:
+        return None  # lege optionele velden komen het vaakst voor
+    if isinstance(value, str):
+        return value.strip() or None
+    return _to_str(value).strip() or None
+
+
+def _lookup(norm: Dict[str, Any], raw: dict, key: str, default: Any = None) -> Any:
+    """``norm.get(key, raw.get(key, default))`` without the eager raw lookup."""
+
+    value = norm.get(key, _MISSING)
+    if value is _MISSING:
+        return raw.get(key, default)
+    return value
+
+
+def _parse_crop(val: Any) -> Optional[Dict[str, int]]:
+    """Parse a logo crop box from a dict, 4-item sequence or "l,t,r,b" text."""
+
+    if not val:
+        return None
+    if isinstance(val, dict):
+        norm_keys = {str(k).lower(): v for k, v in val.items()}
+        keys = {"left", "top", "right", "bottom"}
+        if not keys.issubset(norm_keys.keys()):
+            return None
+        try:
+            return {
+                "left": int(float(norm_keys.get("left", 0))),
+                "top": int(float(norm_keys.get("top", 0))),
+                "right": int(float(norm_keys.get("right", 0))),
+                "bottom": int(float(norm_keys.get("bottom", 0))),
+            }
+        except Exception:
+            return None
+    if isinstance(val, (list, tuple)) and len(val) == 4:
+        try:
+            l, t, r, b = [int(float(x)) for x in val]
+            return {"left": l, "top": t, "right": r, "bottom": b}
+        except Exception:
+            return None
+    if isinstance(val, str):
+        parts = [p for p in (x.strip() for x in _CROP_SPLIT.split(val)) if p]
+        if len(parts) == 4:
+            try:
+                l, t, r, b = [int(float(x)) for x in parts]
+                return {"left": l, "top": t, "right": r, "bottom": b}
+            except Exception:
+                return None
+    return None
+
+
+def _normalize_record(d: dict, which: str) -> Dict[str, Any]:
+    """Rename the recognised keys of ``d`` to their canonical field names."""
+
+    norm = {}
+    key_map = _KEY_MAPS[which]
+    for k, v in d.items():
+        # Goed gevormde JSON gebruikt al de lowercase sleutels: eerst rechtstreeks
+        canon = key_map.get(k) or _canonical_key(k, which)
+        if canon is None:
+            continue
+        norm[canon] = v
+    return norm
+
+
+def _parse_record(
+    d: dict,
+    which: str,
+    name_field: str,
+    name_fallbacks: Tuple[str, ...],
+    text_fields: Tuple[str, ...],
+    missing_msg: str,
+    invalid_names: FrozenSet[str] = frozenset(),
+) -> Tuple[Dict[str, Any], str, bool, Dict[str, Optional[str]]]:
+    """Shared ``from_any`` body: normalize keys, validate name, clean fields.
+
+    Returns ``(norm, name, favorite, cleaned_text_fields)``.
+    """
+
+    norm = _normalize_record(d, which)
+    raw_name = norm.get(name_field)
+    for key in name_fallbacks:
+        if raw_name:
+            break
+        raw_name = d.get(key)
+    name = str(raw_name or "").strip()
+    if not name or name in invalid_names:
+        raise ValueError(missing_msg)
+
+    fav = _lookup(norm, d, "favorite", False)
+    if isinstance(fav, str):
+        fav = fav.strip().lower() in _TRUTHY
+
+    cleaned = {field_name: _clean(norm, field_name) for field_name in text_fields}
+    return norm, name, bool(fav), cleaned
+
+
+def _favorite_flag(value: Any) -> bool:
+    """Favorite flag for one table cell; empty cells (None/NaN/NA) are False."""
+
+    if isinstance(value, str):
+        return value.strip().lower() in _TRUTHY
+    if value is None or (isinstance(value, float) and value != value):
+        return False
+    try:
+        return bool(value)
+    except TypeError:
+        return False  # pd.NA
+
+
+@dataclass(slots=True)
 class Supplier:
     supplier: str
     description: Optional[str] = None
@@ -25,147 +331,89 @@ class Supplier:
     @staticmethod
     def from_any(d: dict) -> "Supplier":
         """Normalize kolomnamen uit CSV/JSON naar canonical fields."""
-        key_map = {
-            # naam & beschrijving
-            "supplier": "supplier",
-            "leverancier": "supplier",
-            "supplier name": "supplier",
-            "naam": "supplier",
-            "description": "description",
-            "beschrijving": "description",
-            "omschrijving": "description",
-            "notes": "description",
-            # id
-            "supplier_id": "supplier_id",
-            "supplier id": "supplier_id",
-            "id": "supplier_id",
-            # adres 1
-            "adres_1": "adres_1",
-            "adres 1": "adres_1",
-            "adres1": "adres_1",
-            "address_1": "adres_1",
-            "address 1": "adres_1",
-            "address": "adres_1",
-            "adress_1": "adres_1",
-            "adress 1": "adres_1",
-            "adress1": "adres_1",
-            "straat": "adres_1",
-            # adres 2
-            "adres_2": "adres_2",
-            "adres 2": "adres_2",
-            "adres2": "adres_2",
-            "address_2": "adres_2",
-            "address 2": "adres_2",
-            "adress_2": "adres_2",
-            "adress 2": "adres_2",
-            "adress2": "adres_2",
-            # postcode
-            "postcode": "postcode",
-            "postal code": "postcode",
-            "zip": "postcode",
-            "zip code": "postcode",
-            # gemeente / stad / city / plaats
-            "gemeente": "gemeente",
-            "stad": "gemeente",
-            "city": "gemeente",
-            "plaats": "gemeente",
-            "town": "gemeente",
-            # land
-            "land": "land",
-            "country": "land",
-            # btw (veel varianten)
-            "btw": "btw",
-            "vat": "btw",
-            "btw nummer": "btw",
-            "btw-nummer": "btw",
-            "btw number": "btw",
-            "vat number": "btw",
-            "btw number:": "btw",
-            "btw nr": "btw",
-            "btw nr.": "btw",
-            "btw-nr": "btw",
-            "btw-nr.": "btw",
-            "btw no": "btw",
-            "btw no.": "btw",
-            "vat no": "btw",
-            "vat no.": "btw",
-            "vat id": "btw",
-            "vat identification number": "btw",
-            "vat reg": "btw",
-            "vat reg.": "btw",
-            "vat reg number": "btw",
-            # contact
-            "contact sales": "contact_sales",
-            "contact_sales": "contact_sales",
-            "sales contact": "contact_sales",
-            "sales_contact": "contact_sales",
-            # email
-            "sales e-mail": "sales_email",
-            "sales email": "sales_email",
-            "e-mail sales": "sales_email",
-            "email sales": "sales_email",
-            "sales_email": "sales_email",
-            "email": "sales_email",
-            "mail": "sales_email",
-            # phone
-            "phone": "phone",
-            "phone number": "phone",
-            "telefoon": "phone",
-            "telefoon nummer": "phone",
-            "tel": "phone",
-            "tel. sales": "phone",
-            "tel sales": "phone",
-            # product type en description
-            "product / product type": "product_type",
-            "product/product type": "product_type",
-            "product type": "product_type",
-            "producttype": "product_type",
-            "product_type": "product_type",
-            "category": "product_type",
-            "categorie": "product_type",
-            # favorite
-            "favorite": "favorite",
-            "favoriet": "favorite",
-            "fav": "favorite",
-        }
-        norm = {}
-        for k, v in d.items():
-            lk = str(k).strip().lower()
-            if lk in key_map:
-                norm[key_map[lk]] = v
-
-        name = str(
-            norm.get("supplier")
-            or d.get("supplier")
-            or d.get("Leverancier")
-            or ""
-        ).strip()
-        if not name or name == "-":
-            raise ValueError("Supplier name is missing in record.")
-
-        fav = norm.get("favorite", d.get("favorite", False))
-        if isinstance(fav, str):
-            fav = fav.strip().lower() in ("1", "true", "yes", "y", "ja")
-
+        _norm, name, favorite, fields = _parse_record(
+            d,
+            "supplier",
+            "supplier",
+            ("supplier", "Leverancier"),
+            _SUPPLIER_TEXT_FIELDS,
+            "Supplier name is missing in record.",
+            invalid_names=frozenset({"-"}),
+        )
         return Supplier(
             supplier=name,
-            description=_to_str(norm.get("description")).strip() or None if ("description" in norm) else None,
-            supplier_id=_to_str(norm.get("supplier_id")).strip() or None if ("supplier_id" in norm) else None,
-            adres_1=_to_str(norm.get("adres_1")).strip() or None if ("adres_1" in norm) else None,
-            adres_2=_to_str(norm.get("adres_2")).strip() or None if ("adres_2" in norm) else None,
-            postcode=_to_str(norm.get("postcode")).strip() or None if ("postcode" in norm) else None,
-            gemeente=_to_str(norm.get("gemeente")).strip() or None if ("gemeente" in norm) else None,
-            land=_to_str(norm.get("land")).strip() or None if ("land" in norm) else None,
-            btw=_to_str(norm.get("btw")).strip() or None if ("btw" in norm) else None,
-            contact_sales=_to_str(norm.get("contact_sales")).strip() or None if ("contact_sales" in norm) else None,
-            sales_email=_to_str(norm.get("sales_email")).strip() or None if ("sales_email" in norm) else None,
-            phone=_to_str(norm.get("phone")).strip() or None if ("phone" in norm) else None,
-            product_type=_to_str(norm.get("product_type")).strip() or None if ("product_type" in norm) else None,
-            product_description=_to_str(norm.get("description")).strip() or None if ("description" in norm) else None,
-            favorite=bool(fav),
+            product_description=fields["description"],
+            favorite=favorite,
+            **fields,
         )
 
-@dataclass
+    @classmethod
+    def from_records(cls, records: List[Any]) -> List["Supplier"]:
+        """Convert raw JSON records (dicts or bare names) to suppliers."""
+        suppliers: List[Supplier] = []
+        # Lokale bindingen: geen attribuut-lookups per record in de lus
+        append = suppliers.append
+        from_any = cls.from_any
+        for rec in records:
+            try:
+                append(cls(supplier=rec) if isinstance(rec, str) else from_any(rec))
+            except Exception:
+                pass
+        return suppliers
+
+    @classmethod
+    def from_dataframe(cls, df) -> List["Supplier"]:
+        """Vectorized ``from_any`` for a whole CSV/Excel table.
+
+        Columns are renamed once via the supplier key map and text cleaning
+        (strip, empty -> ``None``) runs per column with pandas string
+        operations. Rows without a supplier name are skipped instead of
+        raising.
+        """
+        columns = {}
+        for col in df.columns:
+            canon = _canonical_key(col, "supplier")
+            if canon is not None:
+                columns[canon] = df[col]  # latere kolommen winnen, zoals in from_any
+        if "supplier" not in columns:
+            return []
+
+        row_count = len(df)
+        cleaned: Dict[str, List[Optional[str]]] = {}
+        for field_name, series in columns.items():
+            if field_name == "favorite":
+                continue
+            text = series.astype("string").str.strip()
+            keep = text.notna() & (text != "")
+            cleaned[field_name] = text.astype(object).where(keep, None).tolist()
+
+        fav_series = columns.get("favorite")
+        if fav_series is None:
+            favorites = [False] * row_count
+        elif fav_series.dtype.kind in "biuf":
+            # 0/1-kolom met lege cellen wordt float ("1.0"): op waarde testen
+            favorites = (fav_series.astype(float).fillna(0) != 0).tolist()
+        else:
+            favorites = [_favorite_flag(value) for value in fav_series.tolist()]
+
+        empty = [None] * row_count
+        field_values = [(f, cleaned.get(f, empty)) for f in _SUPPLIER_TEXT_FIELDS]
+        descriptions = cleaned.get("description", empty)
+        suppliers: List[Supplier] = []
+        for idx, name in enumerate(cleaned["supplier"]):
+            if not name or name == "-":
+                continue
+            suppliers.append(
+                cls(
+                    supplier=name,
+                    product_description=descriptions[idx],
+                    favorite=bool(favorites[idx]),
+                    **{f: values[idx] for f, values in field_values},
+                )
+            )
+        return suppliers
+
+@dataclass(slots=True)
 class Client:
     name: str
     address: Optional[str] = None
@@ -177,89 +425,26 @@ class Client:
 
     @staticmethod
     def from_any(d: dict) -> "Client":
-        key_map = {
-            "name": "name",
-            "client": "name",
-            "opdrachtgever": "name",
-            "address": "address",
-            "adres": "address",
-            "btw": "vat",
-            "vat": "vat",
-            "btw nummer": "vat",
-            "btw-nummer": "vat",
-            "email": "email",
-            "e-mail": "email",
-            "mail": "email",
-            "favorite": "favorite",
-            "favoriet": "favorite",
-            "fav": "favorite",
-            "logo": "logo_path",
-            "logo_path": "logo_path",
-            "logo file": "logo_path",
-            "logo_file": "logo_path",
-            "logo crop": "logo_crop",
-            "logo_crop": "logo_crop",
-        }
-        norm = {}
-        for k, v in d.items():
-            lk = str(k).strip().lower()
-            if lk in key_map:
-                norm[key_map[lk]] = v
-        name = str(norm.get("name") or d.get("name") or "").strip()
-        if not name:
-            raise ValueError("Client name is missing in record.")
-        fav = norm.get("favorite", d.get("favorite", False))
-        if isinstance(fav, str):
-            fav = fav.strip().lower() in ("1", "true", "yes", "y", "ja")
-
-        def _parse_crop(val: Any) -> Optional[Dict[str, int]]:
-            if not val:
-                return None
-            if isinstance(val, dict):
-                norm_keys = {str(k).lower(): v for k, v in val.items()}
-                keys = {"left", "top", "right", "bottom"}
-                if not keys.issubset(norm_keys.keys()):
-                    return None
-                try:
-                    return {
-                        "left": int(float(norm_keys.get("left", 0))),
-                        "top": int(float(norm_keys.get("top", 0))),
-                        "right": int(float(norm_keys.get("right", 0))),
-                        "bottom": int(float(norm_keys.get("bottom", 0))),
-                    }
-                except Exception:
-                    return None
-            if isinstance(val, (list, tuple)) and len(val) == 4:
-                try:
-                    l, t, r, b = [int(float(x)) for x in val]
-                    return {"left": l, "top": t, "right": r, "bottom": b}
-                except Exception:
-                    return None
-            if isinstance(val, str):
-                parts = [p.strip() for p in val.replace(";", ",").split(",") if p.strip()]
-                if len(parts) == 4:
-                    try:
-                        l, t, r, b = [int(float(x)) for x in parts]
-                        return {"left": l, "top": t, "right": r, "bottom": b}
-                    except Exception:
-                        return None
-            return None
-
-        crop = _parse_crop(norm.get("logo_crop", d.get("logo_crop")))
-        logo_path = _to_str(norm.get("logo_path", d.get("logo_path")))
-        logo_path = logo_path.strip() or None if logo_path is not None else None
+        norm, name, favorite, fields = _parse_record(
+            d,
+            "client",
+            "name",
+            ("name",),
+            _CLIENT_TEXT_FIELDS,
+            "Client name is missing in record.",
+        )
+        crop = _parse_crop(_lookup(norm, d, "logo_crop"))
+        logo_path = _to_str(_lookup(norm, d, "logo_path")).strip() or None
         return Client(
             name=name,
-            address=_to_str(norm.get("address")).strip() or None if ("address" in norm) else None,
-            vat=_to_str(norm.get("vat")).strip() or None if ("vat" in norm) else None,
-            email=_to_str(norm.get("email")).strip() or None if ("email" in norm) else None,
-            favorite=bool(fav),
+            favorite=favorite,
             logo_path=logo_path,
             logo_crop=crop,
+            **fields,
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class DeliveryAddress:
     name: str
     address: Optional[str] = None
@@ -268,32 +453,12 @@ class DeliveryAddress:
 
     @staticmethod
     def from_any(d: dict) -> "DeliveryAddress":
-        key_map = {
-            "name": "name",
-            "naam": "name",
-            "address": "address",
-            "adres": "address",
-            "remarks": "remarks",
-            "opmerking": "remarks",
-            "opmerkingen": "remarks",
-            "favorite": "favorite",
-            "favoriet": "favorite",
-            "fav": "favorite",
-        }
-        norm = {}
-        for k, v in d.items():
-            lk = str(k).strip().lower()
-            if lk in key_map:
-                norm[key_map[lk]] = v
-        name = str(norm.get("name") or d.get("name") or "").strip()
-        if not name:
-            raise ValueError("Delivery address name is missing in record.")
-        fav = norm.get("favorite", d.get("favorite", False))
-        if isinstance(fav, str):
-            fav = fav.strip().lower() in ("1", "true", "yes", "y", "ja")
-        return DeliveryAddress(
-            name=name,
-            address=_to_str(norm.get("address")).strip() or None if ("address" in norm) else None,
-            remarks=_to_str(norm.get("remarks")).strip() or None if ("remarks" in norm) else None,
-            favorite=bool(fav),
+        _norm, name, favorite, fields = _parse_record(
+            d,
+            "delivery",
+            "name",
+            ("name",),
+            _DELIVERY_TEXT_FIELDS,
+            "Delivery address name is missing in record.",
         )
+        return DeliveryAddress(name=name, favorite=favorite, **fields)
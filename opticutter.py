@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+import re
+import sys
+from bisect import bisect_left, insort
 from collections import defaultdict
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Dict, Iterable, List, Mapping, MutableMapping, Optional, Sequence, Tuple
 
+import numpy as np
 import pandas as pd
 
 from helpers import _to_str
@@ -13,6 +18,11 @@ STOCK_LENGTH_MM = 6000
 LONG_STOCK_LENGTH_MM = 12000
 DEFAULT_KERF_MM = 5.0
 
+# Getal met optionele eenheid, na lower() en "," -> "."
+_LENGTH_PATTERN = r"^([+-]?(?:\d+\.?\d*|\.\d+)(?:e[+-]?\d+)?)\s*(mm|cm|m)?$"
+_LENGTH_RE = re.compile(_LENGTH_PATTERN)
+_UNIT_MULTIPLIERS = {"mm": 1.0, "cm": 10.0, "m": 1000.0}
+
 
 @dataclass(slots=True)
 class StockScenarioResult:
@@ -36,7 +46,7 @@ class OpticutterProfileData:
     material: str
     production: str
     pieces: List[OpticutterPieceDetail]
-    lengths_mm: List[int]
+    lengths_mm: np.ndarray  # int32, één waarde per zaagstuk
     blockers: Dict[str, set[str]]
     scenarios: Dict[str, StockScenarioResult]
     best_choice: str
@@ -45,7 +55,7 @@ class OpticutterProfileData:
 
     @property
     def quantity(self) -> int:
-        return len(self.lengths_mm)
+        return int(self.lengths_mm.size)
 
 
 @dataclass(slots=True)
@@ -104,69 +114,182 @@ def parse_length_to_mm(value: object) -> Optional[int]:
             return None
         length = float(value)
     else:
-        text = str(value).strip().lower()
-        if not text:
-            return None
-        text = text.replace(",", ".")
-        multiplier = 1.0
-        if text.endswith("mm"):
-            text = text[:-2]
-        elif text.endswith("cm"):
-            text = text[:-2]
-            multiplier = 10.0
-        elif text.endswith("m"):
-            text = text[:-1]
-            multiplier = 1000.0
-        try:
-            length = float(text) * multiplier
-        except ValueError:
+        text = str(value).strip().lower().replace(",", ".")
+        match = _LENGTH_RE.match(text)
+        if match is None:
             return None
+        number, unit = match.groups()
+        length = float(number) * _UNIT_MULTIPLIERS.get(unit, 1.0)
     if length <= 0:
         return None
     return int(round(length))
 
 
+def parse_lengths_to_mm(values: pd.Series) -> pd.Series:
+    """Vectorized :func:`parse_length_to_mm` for a whole column.
+
+    Returns an ``Int64`` series with ``<NA>`` where the scalar parser returns
+    ``None`` (empty, unparsable or non-positive lengths).
+    """
+
+    text = (
+        values.astype("string")
+        .str.strip()
+        .str.lower()
+        .str.replace(",", ".", regex=False)
+    )
+    parts = text.str.extract(_LENGTH_PATTERN)
+    number = pd.to_numeric(parts[0], errors="coerce")
+    multiplier = parts[1].map(_UNIT_MULTIPLIERS).fillna(1.0).astype(float)
+    length = number * multiplier
+    return length.round().where(length > 0).astype("Int64")
+
+
+def _bfd_pack(
+    lengths_desc: Sequence[int], stock_length: int, kerf: int
+) -> Tuple[int, int, int]:
+    """Best-Fit-Decreasing kern: ``(bars, used_sum, cuts)``.
+
+    Alle waarden zijn gehele getallen in dezelfde eenheid (honderdsten mm),
+    zodat er geen float-tolerantie nodig is. ``lengths_desc`` moet aflopend
+    gesorteerd zijn en mag geen stukken langer dan ``stock_length`` bevatten.
+    De restlengtes per staaf blijven gesorteerd, zodat de krapste passende
+    staaf via ``bisect`` gevonden wordt.
+    """
+
+    remaining: List[int] = []
+    cuts = 0
+    for length in lengths_desc:
+        # Elke geopende staaf bevat al een stuk, dus een extra stuk kost altijd kerf
+        need = length + kerf
+        idx = bisect_left(remaining, need)
+        if idx < len(remaining):
+            rest = remaining.pop(idx) - need
+            cuts += 1
+        else:
+            rest = stock_length - length
+        insort(remaining, rest)
+    bars = len(remaining)
+    return bars, bars * stock_length - sum(remaining), cuts
+
+
+def _length_multiset(centi_desc: np.ndarray) -> Tuple[Tuple[int, int], ...]:
+    """Aflopende ``(lengte, aantal)``-paren van een aflopend gesorteerde array."""
+
+    # Run-length encoding: grenzen waar de lengte verandert
+    bounds = np.concatenate(
+        ([0], np.flatnonzero(np.diff(centi_desc)) + 1, [centi_desc.size])
+    )
+    values = centi_desc[bounds[:-1]]
+    counts = np.diff(bounds)
+    return tuple(zip(values.tolist(), counts.tolist()))
+
+
+@lru_cache(maxsize=1024)
+def _packed_cached(
+    lengths_multiset: Tuple[Tuple[int, int], ...],
+    stock_length_mm: int,
+    kerf_centi_mm: int,
+) -> Tuple[int, float, float, int]:
+    """Pack de stukken en geef ``(bars, waste_mm, waste_pct, cuts)``.
+
+    ``lengths_multiset`` bevat aflopende ``(lengte, aantal)``-paren in
+    honderdsten mm, zodat een cache-sleutel per verschillende lengte één
+    paar bewaart in plaats van één getal per zaagstuk. Lengtes en kerf zijn
+    > 0 en passen volledig in de staaflengte. Het packen is deterministisch
+    op gesorteerde input, dus profielen met dezelfde lengtes hergebruiken
+    het resultaat.
+    """
+
+    lengths_desc = [
+        length for length, count in lengths_multiset for _ in range(count)
+    ]
+    bars, used_centi, cuts = _bfd_pack(
+        lengths_desc, stock_length_mm * 100, kerf_centi_mm
+    )
+
+    waste_mm = (bars * stock_length_mm * 100 - used_centi) / 100.0
+    waste_pct = 0.0
+    if bars > 0:
+        waste_pct = waste_mm / (bars * stock_length_mm) * 100.0
+    return bars, waste_mm, waste_pct, cuts
+
+
 def _calculate_stock_scenario(
-    lengths_mm: Sequence[int],
+    lengths_mm: Sequence[int] | np.ndarray,
     stock_length_mm: int,
     kerf_mm: float,
+    *,
+    already_sorted: bool = False,
 ) -> StockScenarioResult:
-    usable = [float(length) for length in lengths_mm if length and length > 0]
-    if not usable:
+    """Pak ``lengths_mm`` op staven van ``stock_length_mm``.
+
+    Met ``already_sorted=True`` zijn de lengtes al aflopend gesorteerd (zoals
+    ``analyse_profiles`` ze eenmaal per profiel aanlevert) en wordt niet
+    opnieuw gesorteerd.
+    """
+    arr = np.asarray(lengths_mm, dtype=np.float64)
+    usable = arr[arr > 0]
+    if not usable.size:
         return StockScenarioResult(0, 0.0, 0.0, 0, 0)
 
     kerf_mm = max(0.0, float(kerf_mm))
     stock_length_mm = int(stock_length_mm)
     if stock_length_mm <= 0:
-        return StockScenarioResult(0, 0.0, 0.0, len(usable), 0)
+        return StockScenarioResult(0, 0.0, 0.0, int(usable.size), 0)
 
-    used_lengths: List[float] = []
-    dropped = 0
-    cuts = 0
-    for length in sorted(usable, reverse=True):
-        if length > stock_length_mm:
-            dropped += 1
-            continue
-
-        placed = False
-        for idx, used in enumerate(used_lengths):
-            extra_loss = kerf_mm if used > 0 else 0.0
-            if used + extra_loss + length <= stock_length_mm + 1e-6:
-                used_lengths[idx] = used + extra_loss + length
-                cuts += 1
-                placed = True
-                break
-        if not placed:
-            used_lengths.append(length)
-
-    bars = len(used_lengths)
-    waste_mm = float(bars * stock_length_mm - sum(used_lengths))
-    waste_pct = 0.0
-    if bars > 0:
-        waste_pct = waste_mm / (bars * stock_length_mm) * 100.0
+    if usable.max() > stock_length_mm:
+        kept = usable[usable <= stock_length_mm]
+        dropped = int(usable.size - kept.size)
+        if not kept.size:
+            return StockScenarioResult(0, 0.0, 0.0, dropped, 0)
+    else:
+        kept = usable
+        dropped = 0
+
+    centi = np.rint(kept * 100.0).astype(np.int64)
+    if not already_sorted:
+        centi = np.sort(centi)[::-1]
+    bars, waste_mm, waste_pct, cuts = _packed_cached(
+        _length_multiset(centi), stock_length_mm, int(round(kerf_mm * 100))
+    )
+    # Verse instantie per oproep: het gecachte resultaat is een tuple
     return StockScenarioResult(bars, waste_mm, waste_pct, dropped, cuts)
 
 
+def _widen_single_bar(
+    result: StockScenarioResult, stock_length_mm: int, longer_stock_mm: int
+) -> StockScenarioResult:
+    """Herbereken een scenario met één staaf voor een langere staaflengte.
+
+    De stukken passen al in één staaf van ``stock_length_mm``; op een langere
+    staaf blijft de zaagplanning identiek en groeit enkel het afval.
+    """
+
+    used_centi = round((stock_length_mm - result.waste_mm) * 100)
+    waste_mm = (longer_stock_mm * 100 - used_centi) / 100.0
+    waste_pct = waste_mm / longer_stock_mm * 100.0
+    return StockScenarioResult(1, waste_mm, waste_pct, 0, result.cuts)
+
+
+def _best_scenario(scenarios: Mapping[str, StockScenarioResult]) -> str:
+    """Scenario met de minste staven, dan minste afval; anders ``"input"``."""
+
+    keys = list(scenarios)
+    results = scenarios.values()
+    bars = np.fromiter((r.bars for r in results), dtype=np.int64, count=len(keys))
+    waste = np.fromiter((r.waste_pct for r in results), dtype=np.float64, count=len(keys))
+    dropped = np.fromiter(
+        (r.dropped_pieces for r in results), dtype=np.int64, count=len(keys)
+    )
+    valid = np.flatnonzero((dropped == 0) & (bars > 0))
+    if not valid.size:
+        return "input"
+    # lexsort is stabiel: bij gelijke score wint de eerste scenario-sleutel
+    order = np.lexsort((waste[valid], bars[valid]))
+    return keys[valid[order[0]]]
+
+
 def _normalize_production(value: str) -> str:
     text = _to_str(value).strip()
     return text or "_Onbekend"
@@ -196,34 +319,25 @@ def analyse_profiles(
             error="BOM mist profielgegevens.",
         )
 
-    profiles_df = bom_df.loc[:, required_columns].copy()
-    profiles_df["Description"] = (
-        bom_df.get("Description", "").fillna("").astype(str).str.strip()
-    )
-    if "Material" in bom_df.columns:
-        profiles_df["Material"] = (
-            bom_df["Material"].fillna("").astype(str).str.strip()
-        )
-    elif "Materiaal" in bom_df.columns:
-        profiles_df["Material"] = (
-            bom_df["Materiaal"].fillna("").astype(str).str.strip()
-        )
-    else:
-        profiles_df["Material"] = ""
-    profiles_df["Production"] = (
-        bom_df.get("Production", "").fillna("").astype(str).str.strip()
-    )
-    profiles_df["PartNumber"] = (
-        profiles_df["PartNumber"].fillna("").astype(str).str.strip()
-    )
-    profiles_df["Profile"] = (
-        profiles_df["Profile"].fillna("").astype(str).str.strip()
-    )
-    profiles_df["Length profile"] = (
-        profiles_df["Length profile"].fillna("").astype(str).str.strip()
-    )
-    profiles_df["Aantal"] = (
-        pd.to_numeric(profiles_df["Aantal"], errors="coerce").fillna(0).astype(int)
+    def text_column(*names: str) -> pd.Series:
+        for name in names:
+            if name in bom_df.columns:
+                return bom_df[name].fillna("").astype(str).str.strip()
+        return pd.Series("", index=bom_df.index, dtype=object)
+
+    # Enkel de benodigde kolommen, in één keer opgebouwd (geen kopie van de BOM)
+    profiles_df = pd.DataFrame(
+        {
+            "PartNumber": text_column("PartNumber"),
+            "Profile": text_column("Profile"),
+            "Length profile": text_column("Length profile"),
+            "Aantal": pd.to_numeric(bom_df["Aantal"], errors="coerce")
+            .fillna(0)
+            .astype(int),
+            "Description": text_column("Description"),
+            "Material": text_column("Material", "Materiaal"),
+            "Production": text_column("Production"),
+        }
     )
 
     filtered = profiles_df[profiles_df["Profile"] != ""].copy()
@@ -240,11 +354,11 @@ def analyse_profiles(
             error="Geen profielen gevonden in de BOM.",
         )
 
-    filtered["Length profile mm"] = filtered["Length profile"].map(parse_length_to_mm)
+    filtered["Length profile mm"] = parse_lengths_to_mm(filtered["Length profile"])
 
     manual_lengths = dict(manual_lengths or {})
 
-    pieces_by_profile: Dict[Tuple[str, str, str], List[int]] = defaultdict(list)
+    pieces_by_profile: Dict[Tuple[str, str, str], np.ndarray] = {}
     detail_map: Dict[Tuple[str, str, str], List[OpticutterPieceDetail]] = defaultdict(list)
     blockers: Dict[Tuple[str, str, str], Dict[str, set[str]]] = defaultdict(
         lambda: {"6000": set(), "12000": set(), "custom": set()}
@@ -253,45 +367,62 @@ def analyse_profiles(
     oversized_profiles: set[str] = set()
     oversized_profiles_12m: set[str] = set()
 
-    for _, row in filtered.iterrows():
-        profile_name = row["Profile"]
-        material_name = row.get("Material", "")
-        production_name = row.get("Production", "")
-        length_mm = row.get("Length profile mm")
-        qty = int(row.get("Aantal", 0))
-        if qty <= 0:
-            continue
-        key = (profile_name, material_name, production_name)
-
-        if length_mm is None:
-            length_text = row.get("Length profile", "")
-            if length_text:
-                unparsed_lengths.append(str(length_text))
-            continue
-
-        if length_mm > STOCK_LENGTH_MM:
-            oversized_profiles.add(profile_name)
-        if length_mm > LONG_STOCK_LENGTH_MM:
-            oversized_profiles_12m.add(profile_name)
-
-        pieces_by_profile[key].extend([length_mm] * qty)
-        description = row.get("Description", "")
-        part_number = row.get("PartNumber", "")
-        length_label = row.get("Length profile", "") or f"{length_mm} mm"
-        part_label = str(part_number) if part_number else "Onbekend part"
-        if description:
-            if part_number:
-                part_label = f"{part_label} - {description}"
-            else:
-                part_label = description
-        blocker_text = f"{part_label} ({length_label})"
-        if length_mm > STOCK_LENGTH_MM:
-            blockers[key]["6000"].add(blocker_text)
-        if length_mm > LONG_STOCK_LENGTH_MM:
-            blockers[key]["12000"].add(blocker_text)
-        if custom_stock_mm is not None and length_mm > custom_stock_mm:
-            blockers[key]["custom"].add(blocker_text)
-        detail_map[key].append(OpticutterPieceDetail(length_mm=length_mm, label=blocker_text))
+    active = filtered[filtered["Aantal"] > 0]
+    length_values = active["Length profile mm"]
+    parsed_mask = length_values.notna()
+
+    unparsed_text = active.loc[~parsed_mask, "Length profile"]
+    unparsed_lengths.extend(unparsed_text[unparsed_text != ""].astype(str).tolist())
+
+    parsed = active[parsed_mask]
+    lengths_col = parsed["Length profile mm"].astype("int64")
+    oversized_profiles.update(parsed.loc[lengths_col > STOCK_LENGTH_MM, "Profile"])
+    oversized_profiles_12m.update(
+        parsed.loc[lengths_col > LONG_STOCK_LENGTH_MM, "Profile"]
+    )
+
+    # Labels per rij in één kolombewerking i.p.v. per iterrows()-Series
+    part_number = parsed["PartNumber"]
+    description = parsed["Description"]
+    part_label = part_number.where(part_number != "", "Onbekend part")
+    part_label = part_label.where(
+        description == "",
+        (part_number + " - " + description).where(part_number != "", description),
+    )
+    length_label = parsed["Length profile"].where(
+        parsed["Length profile"] != "", lengths_col.astype(str) + " mm"
+    )
+    blocker_texts = part_label + " (" + length_label + ")"
+
+    lengths_arr = lengths_col.to_numpy()
+    qty_arr = parsed["Aantal"].to_numpy()
+    # Herhaalde labels (zelfde part/lengte) één keer hashen en interneren
+    label_codes, unique_labels = pd.factorize(blocker_texts)
+    label_pool = np.array([sys.intern(text) for text in unique_labels], dtype=object)
+    label_arr = label_pool[label_codes]
+    limits = [("6000", STOCK_LENGTH_MM), ("12000", LONG_STOCK_LENGTH_MM)]
+    if custom_stock_mm is not None:
+        limits.append(("custom", custom_stock_mm))
+    # sort=True: de groepen (en dus pieces_by_profile) staan al in profielvolgorde
+    groups = parsed.groupby(["Profile", "Material", "Production"], sort=True).indices
+    for key, positions in groups.items():
+        group_lengths = lengths_arr[positions]
+        group_labels = label_arr[positions]
+        group_codes = label_codes[positions]
+        # Eén C-expansie per profiel i.p.v. extend([lengte] * aantal) per rij
+        pieces_by_profile[key] = np.repeat(
+            group_lengths.astype(np.int32), qty_arr[positions]
+        )
+        detail_map[key] = [
+            OpticutterPieceDetail(length_mm=length_mm, label=label)
+            for length_mm, label in zip(group_lengths.tolist(), group_labels)
+        ]
+        for blocker_key, limit in limits:
+            too_long = group_lengths > limit
+            if too_long.any():
+                blockers[key][blocker_key].update(
+                    label_pool[np.unique(group_codes[too_long])]
+                )
 
     if not pieces_by_profile:
         return OpticutterAnalysis(
@@ -310,6 +441,7 @@ def analyse_profiles(
         filtered.groupby(
             ["PartNumber", "Profile", "Length profile", "Material", "Production"],
             as_index=False,
+            sort=False,  # sort_values hieronder bepaalt de volgorde
         )["Aantal"].sum()
         .sort_values(
             by=["Profile", "Material", "Production", "PartNumber", "Length profile"]
@@ -318,55 +450,62 @@ def analyse_profiles(
 
     profiles: List[OpticutterProfileData] = []
 
-    sorted_keys = sorted(
-        pieces_by_profile.keys(), key=lambda item: (item[0], item[1], item[2])
-    )
-
-    for key_tuple in sorted_keys:
+    for key_tuple, lengths in pieces_by_profile.items():
         profile_name, material_name, production_name = key_tuple
-        lengths = pieces_by_profile.get(key_tuple, [])
-        detail_list = detail_map.get(key_tuple, [])
+        # De maps worden na deze lus niet meer gelezen: lijsten overnemen i.p.v. kopiëren
+        detail_list = detail_map.pop(key_tuple, [])
+        max_length = int(lengths.max()) if lengths.size else 0
+
+        # Eén sortering per profiel, gedeeld door alle staaflengtes
+        lengths_desc = np.sort(lengths)[::-1]
+        scenario_6m = _calculate_stock_scenario(
+            lengths_desc, STOCK_LENGTH_MM, kerf_mm, already_sorted=True
+        )
+        # Past alles in één 6 m-staaf, dan verandert enkel het afval bij langere staven
+        single_bar = (
+            scenario_6m
+            if scenario_6m.bars == 1 and not scenario_6m.dropped_pieces
+            else None
+        )
 
-        scenario_6m = _calculate_stock_scenario(lengths, STOCK_LENGTH_MM, kerf_mm)
-        scenario_12m = _calculate_stock_scenario(lengths, LONG_STOCK_LENGTH_MM, kerf_mm)
+        def scenario_for(stock_length_mm: int) -> StockScenarioResult:
+            if single_bar is not None and stock_length_mm >= STOCK_LENGTH_MM:
+                return _widen_single_bar(single_bar, STOCK_LENGTH_MM, stock_length_mm)
+            return _calculate_stock_scenario(
+                lengths_desc, stock_length_mm, kerf_mm, already_sorted=True
+            )
+
+        scenario_12m = scenario_for(LONG_STOCK_LENGTH_MM)
         scenarios: Dict[str, StockScenarioResult] = {
             "6000": scenario_6m,
             "12000": scenario_12m,
         }
 
         if custom_stock_mm is not None:
-            scenarios["custom"] = _calculate_stock_scenario(
-                lengths, custom_stock_mm, kerf_mm
-            )
+            scenarios["custom"] = scenario_for(custom_stock_mm)
 
         manual_length = manual_lengths.get(key_tuple)
         manual_key: Optional[str] = None
         if manual_length is not None and manual_length > 0:
-            scenarios_manual = _calculate_stock_scenario(lengths, manual_length, kerf_mm)
+            scenarios_manual = scenario_for(manual_length)
             manual_key = f"manual:{manual_length}"
             scenarios[manual_key] = scenarios_manual
-            exceeding_manual = {
-                piece.label
-                for piece in detail_list
-                if piece.length_mm > manual_length
-            }
+            exceeding_manual = (
+                {
+                    piece.label
+                    for piece in detail_list
+                    if piece.length_mm > manual_length
+                }
+                if manual_length < max_length
+                else set()
+            )
             blockers_entry = blockers[key_tuple]
             if exceeding_manual:
                 blockers_entry[manual_key] = exceeding_manual
             else:
                 blockers_entry.pop(manual_key, None)
 
-        best_choice: Optional[str] = None
-        best_score: Optional[Tuple[int, float]] = None
-        for candidate_key, result in scenarios.items():
-            if result.dropped_pieces or result.bars <= 0:
-                continue
-            score = (result.bars, result.waste_pct)
-            if best_score is None or score < best_score:
-                best_choice = candidate_key
-                best_score = score
-        if best_choice is None:
-            best_choice = "input"
+        best_choice = _best_scenario(scenarios)
 
         profiles.append(
             OpticutterProfileData(
@@ -374,8 +513,8 @@ def analyse_profiles(
                 profile=profile_name,
                 material=material_name,
                 production=production_name,
-                pieces=list(detail_list),
-                lengths_mm=list(lengths),
+                pieces=detail_list,
+                lengths_mm=lengths,
                 blockers=blockers[key_tuple],
                 scenarios=scenarios,
                 best_choice=best_choice,
@@ -384,7 +523,8 @@ def analyse_profiles(
             )
         )
 
-    total_qty = int(filtered["Aantal"].sum())
+    # Som van de groepssommen: geen tweede pass over alle BOM-rijen
+    total_qty = int(aggregated["Aantal"].sum())
 
     aggregated_rows = (
         aggregated.to_dict(orient="records") if not aggregated.empty else []
@@ -15,25 +15,46 @@ import io
 import tempfile
 import hashlib
 import math
+import multiprocessing
+import numbers
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from copy import copy
+from functools import lru_cache
 from pathlib import Path
+from xml.sax.saxutils import escape as xml_escape
 from typing import Callable, Dict, List, Mapping, Optional, Sequence, Tuple
 
 import pandas as pd
 from dataclasses import dataclass
 try:
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
     from openpyxl.styles import Alignment, Font
     from openpyxl.utils import get_column_letter
 except Exception:  # pragma: no cover - optional dependency
+    Workbook = None
+    WriteOnlyCell = None
     Alignment = None
     Font = None
     get_column_letter = None
 
+try:
+    import xlsxwriter  # noqa: F401
+    XLSXWRITER_OK = True
+except Exception:  # pragma: no cover - optional dependency
+    XLSXWRITER_OK = False
+
 try:
     from PyPDF2 import PdfMerger
 except Exception:  # pragma: no cover - PyPDF2 might be absent
     PdfMerger = None
 
+try:
+    import pikepdf
+except Exception:  # pragma: no cover - optional dependency
+    pikepdf = None
+
 # ReportLab (PDF). Script works without it (PDF generation is skipped).
 try:
     from reportlab.lib.pagesizes import A4
@@ -62,7 +83,7 @@ from opticutter import (
     OpticutterExportContext,
     OpticutterProductionExport,
     OpticutterSelection,
-    parse_length_to_mm,
+    parse_lengths_to_mm,
     prepare_opticutter_export,
 )
 
@@ -137,7 +158,34 @@ class OpticutterOrderComputation:
 
 
 _INVALID_PATH_CHARS = set('<>:"/\\|?*')
+# Ongeldige tekens en stuurtekens worden "_". Padscheidingstekens vallen
+# daar al onder (zowel "/" als "\").
+_SANITIZE_TABLE = {ord(ch): "_" for ch in _INVALID_PATH_CHARS}
+_SANITIZE_TABLE.update({code: "_" for code in range(32)})
 _WINDOWS_MAX_PATH = 240
+_COPY_WORKERS = 8
+# Vanaf zoveel bestelbonregels (over alle producties) loont een procespool
+# voor het renderen van de PDF's.
+_PDF_PROCESS_MIN_ITEMS = 1000
+
+
+def _copy_files(copy_jobs: Mapping[str, str]) -> None:
+    """Copy ``{dst: src}`` pairs, overlapping the I/O on a small thread pool.
+
+    Eén bron per doel: bij dubbele doelnamen wint (zoals bij sequentieel
+    kopiëren) de laatst toegevoegde bron, zonder race tussen threads.
+    """
+
+    if not copy_jobs:
+        return
+    if len(copy_jobs) == 1:
+        ((dst, src),) = copy_jobs.items()
+        shutil.copy2(src, dst)
+        return
+    workers = min(_COPY_WORKERS, len(copy_jobs))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        # list() laat een eventuele kopieerfout hier opborrelen
+        list(pool.map(lambda job: shutil.copy2(job[1], job[0]), copy_jobs.items()))
 
 
 def _sanitize_component(value: object) -> str:
@@ -147,15 +195,12 @@ def _sanitize_component(value: object) -> str:
     if not text:
         return ""
     text = " ".join(text.split())
-    cleaned: List[str] = []
-    for ch in text:
-        if ch in _INVALID_PATH_CHARS or ord(ch) < 32:
-            cleaned.append("_")
-        elif ch == os.sep or (os.altsep and ch == os.altsep):
-            cleaned.append("-")
-        else:
-            cleaned.append(ch)
-    return "".join(cleaned).strip(" .-_")
+    return text.translate(_SANITIZE_TABLE).strip(" .-_")
+
+
+_SLUG_INVALID_RE = re.compile(r"[^a-z0-9-]")
+_SLUG_DASHES_RE = re.compile(r"-+")
+_SLUG_FALLBACK_INVALID_RE = re.compile(r"[^a-zA-Z0-9-]")
 
 
 def _slugify_name(value: object, fallback: str) -> str:
@@ -165,15 +210,15 @@ def _slugify_name(value: object, fallback: str) -> str:
     ascii_text = normalized.encode("ascii", "ignore").decode("ascii")
     ascii_text = ascii_text.lower()
     ascii_text = ascii_text.replace(" ", "-")
-    ascii_text = re.sub(r"[^a-z0-9-]", "", ascii_text)
-    ascii_text = re.sub(r"-+", "-", ascii_text).strip("-")
+    ascii_text = _SLUG_INVALID_RE.sub("", ascii_text)
+    ascii_text = _SLUG_DASHES_RE.sub("-", ascii_text).strip("-")
     if len(ascii_text) > 40:
         ascii_text = ascii_text[:40].rstrip("-")
     if ascii_text:
         return ascii_text
     fallback_norm = unicodedata.normalize("NFKD", fallback)
     ascii_fallback = fallback_norm.encode("ascii", "ignore").decode("ascii") or fallback
-    ascii_fallback = re.sub(r"[^a-zA-Z0-9-]", "", ascii_fallback)
+    ascii_fallback = _SLUG_FALLBACK_INVALID_RE.sub("", ascii_fallback)
     ascii_fallback = ascii_fallback.lower()[:40].rstrip("-")
     return ascii_fallback or "export"
 
@@ -257,13 +302,25 @@ def _create_combined_output_dir(
     return candidate
 
 
+def _is_blank_qty(value: object) -> bool:
+    """Return ``True`` for an empty quantity cell ("", "nan", None or NaN)."""
+
+    if value is None:
+        return True
+    if isinstance(value, str):
+        return value.strip() in ("", "nan")
+    return isinstance(value, float) and value != value
+
+
 def _export_bom_workbook(bom_df: pd.DataFrame, dest: str, filename: str) -> str:
     """Write the processed BOM dataframe to an Excel workbook."""
 
     if not filename.lower().endswith(".xlsx"):
         filename = f"{filename}.xlsx"
     target_path = os.path.join(dest, filename)
-    export_df = bom_df.reset_index(drop=True).copy()
+    # reset_index levert al een nieuw frame; toevoegen/overschrijven van
+    # kolommen raakt bom_df niet, dus een extra diepe kopie is overbodig.
+    export_df = bom_df.reset_index(drop=True)
     # Drop status-related columns that are only useful inside the app.
     to_drop = [col for col in _BOM_STATUS_COLUMNS if col in export_df.columns]
     if to_drop:
@@ -272,50 +329,75 @@ def _export_bom_workbook(bom_df: pd.DataFrame, dest: str, filename: str) -> str:
     # Normalise quantity column naming to ``QTY.`` and drop aliases.
     qty_aliases: Tuple[str, ...] = ("QTY.", "Qty.", "Qty", "Quantity", "Aantal")
     qty_columns = [col for col in qty_aliases if col in export_df.columns]
-    if "QTY." not in export_df.columns:
-        if qty_columns:
-            export_df = export_df.rename(columns={qty_columns[0]: "QTY."})
-        else:
-            export_df["QTY."] = ""
-    for alias in qty_columns:
-        if alias == "QTY." or alias not in export_df.columns:
-            continue
-        source = export_df[alias]
-        destination = export_df["QTY."]
-        dest_str = destination.astype(str)
-        missing_mask = dest_str.str.strip().isin(("", "nan"))
-        export_df.loc[missing_mask, "QTY."] = source[missing_mask]
-        export_df = export_df.drop(columns=alias)
+    if qty_columns:
+        # Per rij de eerste niet-lege alias: van achter naar voor aanvullen
+        # met where, zodat elke alias één keer vectorieel bekeken wordt.
+        qty: pd.Series | None = None
+        for alias in reversed(qty_columns):
+            values = export_df[alias]
+            if pd.api.types.is_numeric_dtype(values):
+                blank = values.isna()
+            else:
+                blank = values.map(_is_blank_qty).astype(bool)
+            qty = values.where(~blank) if qty is None else values.where(~blank, qty)
+        export_df = export_df.drop(columns=qty_columns)
+        export_df["QTY."] = qty.where(qty.notna(), "")
 
     # Ensure all primary BOM columns are present and appear first.
-    for column in _BOM_EXPORT_BASE_COLUMNS:
-        if column not in export_df.columns:
-            export_df[column] = ""
-    ordered_columns = [c for c in _BOM_EXPORT_BASE_COLUMNS if c in export_df.columns]
-    remaining_columns = [c for c in export_df.columns if c not in ordered_columns]
-    export_df = export_df[ordered_columns + remaining_columns]
-
-    with pd.ExcelWriter(target_path, engine="openpyxl") as writer:
-        export_df.to_excel(writer, index=False, sheet_name="BOM")
-        if Alignment is not None and get_column_letter is not None:
+    # reindex voegt alle ontbrekende kolommen in één keer toe.
+    desired_columns = list(_BOM_EXPORT_BASE_COLUMNS) + [
+        c for c in export_df.columns if c not in _BOM_EXPORT_BASE_COLUMNS
+    ]
+    export_df = export_df.reindex(columns=desired_columns, fill_value="")
+
+    # Kolombreedte uit de data zelf: langste tekstweergave (kop inbegrepen),
+    # begrensd tussen 12 en 80 tekens.
+    widths: List[int] = []
+    for col in export_df.columns:
+        values = export_df[col]
+        lengths = values.astype(str).str.len().where(values.notna(), 0)
+        max_length = max(int(lengths.max()) if len(lengths) else 0, len(str(col)))
+        widths.append(min(max(12, max_length + 2), 80))
+
+    if XLSXWRITER_OK:
+        with pd.ExcelWriter(target_path, engine="xlsxwriter") as writer:
+            export_df.to_excel(writer, index=False, sheet_name="BOM")
             ws = writer.sheets["BOM"]
-            alignment = Alignment(wrap_text=False, vertical="top")
-            for row in ws.iter_rows():
-                for cell in row:
-                    cell.alignment = alignment
-            for col_idx in range(1, ws.max_column + 1):
-                column_letter = get_column_letter(col_idx)
-                max_length = 0
-                for cell in ws[column_letter]:
-                    value = cell.value
-                    cell_length = len(str(value)) if value is not None else 0
-                    if cell_length > max_length:
-                        max_length = cell_length
-                ws.column_dimensions[column_letter].width = min(max(12, max_length + 2), 80)
+            top_fmt = writer.book.add_format({"valign": "top"})
+            for col_idx, (col, width) in enumerate(zip(export_df.columns, widths)):
+                ws.set_column(col_idx, col_idx, width, top_fmt)
+                ws.write(0, col_idx, col, top_fmt)
+    elif Workbook is not None:
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet("BOM")
+        for col_idx, width in enumerate(widths, start=1):
+            ws.column_dimensions[get_column_letter(col_idx)].width = width
+        # De opmaak één keer registreren op een prototypecel; per cel enkel
+        # de StyleArray kopiëren. ``cell.alignment = ...`` zou de Alignment
+        # voor elke cel opnieuw hashen en opzoeken in de stijltabel.
+        top_cell = WriteOnlyCell(ws)
+        top_cell.alignment = Alignment(wrap_text=False, vertical="top")
+        top_style = top_cell._style
+
+        def _aligned(value: object) -> WriteOnlyCell:
+            cell = WriteOnlyCell(ws, value=value)
+            cell._style = copy(top_style)
+            return cell
+
+        ws.append([_aligned(col) for col in export_df.columns])
+        body = export_df.astype(object).where(export_df.notna(), None)
+        for values in body.itertuples(index=False, name=None):
+            ws.append([_aligned(value) for value in values])
+        wb.save(target_path)
+    else:
+        export_df.to_excel(target_path, index=False, sheet_name="BOM")
 
     return target_path
 
 
+_BOM_STEM_RE = re.compile(r"(.*?\bBOM\b)", re.IGNORECASE)
+
+
 def make_bom_export_filename(
     bom_source_path: Optional[str],
     date_iso: str,
@@ -326,7 +408,7 @@ def make_bom_export_filename(
     source_stem = ""
     if bom_source_path:
         source_stem = Path(bom_source_path).stem
-        match = re.search(r"(.*?\bBOM\b)", source_stem, flags=re.IGNORECASE)
+        match = _BOM_STEM_RE.search(source_stem)
         if match:
             source_stem = match.group(1)
         source_stem = source_stem.rstrip(" -_.")
@@ -347,22 +429,39 @@ def find_related_bom_exports(
     stem = Path(bom_source_path).stem.lower()
     if not stem:
         return []
-    matches: List[str] = []
-    seen: set[str] = set()
-    for key in sorted(file_index.keys(), key=len, reverse=True):
-        if not key:
-            continue
-        key_lower = key.lower()
+    # Een sleutel telt enkel als hij niet midden in een woord staat: begin en
+    # einde liggen op een niet-alfanumerieke grens. Alleen deelstrings tussen
+    # zulke grenzen komen dus in aanmerking; die zoeken we rechtstreeks op in
+    # plaats van elke sleutel in de stam te zoeken.
+    starts = [i for i in range(len(stem)) if i == 0 or not stem[i - 1].isalnum()]
+    ends = [
+        j for j in range(1, len(stem) + 1) if j == len(stem) or not stem[j].isalnum()
+    ]
+    candidates = {stem[i:j] for i in starts for j in ends if j > i}
+
+    keys_by_lower: Dict[str, List[Tuple[int, str]]] = defaultdict(list)
+    for order, key in enumerate(file_index.keys()):
+        if key:
+            key_lower = key.lower()
+            if key_lower in candidates:
+                keys_by_lower[key_lower].append((order, key))
+
+    matched: List[Tuple[int, int, str]] = []
+    for key_lower, keys in keys_by_lower.items():
         if len(key_lower) < 4 and not any(ch.isdigit() for ch in key_lower):
             continue
+        # Zoals voorheen beslist de eerste vindplaats in de stam.
         idx = stem.find(key_lower)
-        if idx == -1:
-            continue
         if idx > 0 and stem[idx - 1].isalnum():
             continue
         end = idx + len(key_lower)
         if end < len(stem) and stem[end].isalnum():
             continue
+        matched.extend((-len(key), order, key) for order, key in keys)
+
+    matches: List[str] = []
+    seen: set[str] = set()
+    for _neg_len, _order, key in sorted(matched):
         for src_file in file_index.get(key, []):
             if src_file not in seen:
                 matches.append(src_file)
@@ -406,23 +505,28 @@ def _normalize_crop_box(
 
 from helpers import (
     _to_str,
+    _to_clean_str,
     _num_to_2dec,
     _pn_wrap_25,
     _material_nowrap,
     _build_file_index,
+    _normalize_file_index,
 )
 from models import Supplier, Client, DeliveryAddress
 from suppliers_db import SuppliersDB, SUPPLIERS_DB_FILE
 from bom import load_bom  # noqa: F401 - imported for module dependency
 
 
+_QTY_CLEAN_RE = re.compile(r"[^0-9.]+")
+
+
 def _parse_qty(val: object) -> int:
     """Parse quantity values to int within [1, 999]."""
-    s = _to_str(val).strip()
+    s = _to_clean_str(val)
     if not s:
         return 1
     s = s.replace(",", ".")
-    s = re.sub(r"[^0-9.]+", "", s)
+    s = _QTY_CLEAN_RE.sub("", s)
     try:
         q = int(float(s))
     except Exception:
@@ -430,6 +534,29 @@ def _parse_qty(val: object) -> int:
     return max(1, min(999, q))
 
 
+def _parse_qty_series(values: pd.Series) -> pd.Series:
+    """Vectorized :func:`_parse_qty` for a whole ``Aantal`` column."""
+    text = (
+        values.map(_to_str)
+        .str.strip()
+        .str.replace(",", ".", regex=False)
+        .str.replace(_QTY_CLEAN_RE, "", regex=True)
+    )
+    numbers = pd.to_numeric(text, errors="coerce")
+    return numbers.fillna(1).clip(lower=0).apply(math.floor).clip(1, 999).astype(int)
+
+
+def _format_supplier_address(supplier: Supplier) -> str:
+    """Return the supplier address as one comma-separated line."""
+
+    pc_gem = " ".join(x for x in (supplier.postcode, supplier.gemeente) if x)
+    return ", ".join(
+        part
+        for part in (supplier.adres_1, supplier.adres_2, pc_gem, supplier.land)
+        if part
+    )
+
+
 def _coerce_integer_like(value: object) -> object:
     """Return ``value`` as an int when it represents a whole number."""
 
@@ -439,7 +566,7 @@ def _coerce_integer_like(value: object) -> object:
         return value
     if isinstance(value, float):
         return int(round(value)) if math.isfinite(value) else value
-    text = _to_str(value).strip()
+    text = _to_clean_str(value)
     if not text:
         return ""
     text = text.replace(",", ".")
@@ -479,6 +606,10 @@ def _prefix_for_doc_type(doc_type: str) -> str:
     return ""
 
 
+_DOC_PREFIX_INVALID_RE = re.compile(r"[^A-Z0-9]")
+_DOC_TYPE_SLUG_RE = re.compile(r"[^0-9a-z]+")
+
+
 def _normalize_doc_number(value: object, doc_type: object) -> str:
     """Return a cleaned document number for a given ``doc_type``.
 
@@ -487,7 +618,7 @@ def _normalize_doc_number(value: object, doc_type: object) -> str:
     replaced instead of duplicated (``"BB-BB123"`` → ``"BB-123"``).
     """
 
-    doc_num = _to_str(value).strip()
+    doc_num = _to_clean_str(value)
     if not doc_num:
         return ""
 
@@ -497,7 +628,7 @@ def _normalize_doc_number(value: object, doc_type: object) -> str:
 
     prefix_upper = prefix.upper()
     doc_upper = doc_num.upper()
-    prefix_compact = re.sub(r"[^A-Z0-9]", "", prefix_upper)
+    prefix_compact = _DOC_PREFIX_INVALID_RE.sub("", prefix_upper)
 
     if doc_upper.startswith(prefix_upper):
         remainder = doc_num[len(prefix) :]
@@ -540,15 +671,20 @@ OPTICUTTER_KEY_PREFIX = "opticutter::"
 OPTICUTTER_DEFAULT_SUFFIX = "::Opticutter"
 
 
+_FINISH_SEPARATORS_RE = re.compile(r"[\\/:]+")
+_FINISH_WHITESPACE_RE = re.compile(r"\s+")
+_FINISH_INVALID_RE = re.compile(r"[^0-9A-Za-z._ \-]+")
+
+
 def _normalize_finish_folder(value: object) -> str:
     """Return a filesystem-friendly folder component for finish/RAL names."""
 
-    text = _to_str(value).strip()
+    text = _to_clean_str(value)
     if not text:
         text = "_Onbekend"
-    text = re.sub(r"[\\/:]+", "-", text)
-    text = re.sub(r"\s+", " ", text)
-    text = re.sub(r"[^0-9A-Za-z._ \-]+", "_", text)
+    text = _FINISH_SEPARATORS_RE.sub("-", text)
+    text = _FINISH_WHITESPACE_RE.sub(" ", text)
+    text = _FINISH_INVALID_RE.sub("_", text)
     text = text.strip(" .-_")
     if not text:
         text = "_Onbekend"
@@ -607,7 +743,11 @@ def parse_selection_key(key: str) -> Tuple[str, str]:
 def _parse_weight_kg(value: object) -> float | None:
     """Parse a textual kilogram value to float."""
 
-    text = _to_str(value).strip()
+    # Snelle weg: pandas levert het gewicht vaak al als getal aan
+    if isinstance(value, (float, int)) and not isinstance(value, bool):
+        number = float(value)
+        return number if math.isfinite(number) else None
+    text = _to_clean_str(value)
     if not text:
         return None
     text = text.replace(" ", "")
@@ -643,40 +783,73 @@ def _collect_opticutter_profile_stats(
     stats: Dict[tuple[str, str, str], OpticutterProfileStats] = defaultdict(
         OpticutterProfileStats
     )
-    for _, row in bom_df.iterrows():
-        profile_name = _to_str(row.get("Profile")).strip()
-        if not profile_name:
-            continue
-        material_name = _to_str(row.get("Materiaal") or row.get("Material")).strip()
-        production_name = _to_str(row.get("Production")).strip() or "_Onbekend"
-        weight_each = _parse_weight_kg(row.get("Gewicht"))
-        if weight_each is None or weight_each <= 0:
-            continue
-        qty_raw = row.get("Aantal", 0)
-        try:
-            qty = int(float(qty_raw))
-        except Exception:
-            qty = 0
-        if qty <= 0:
-            continue
-        length_mm: int | None = None
-        length_value = row.get("Length profile mm")
-        if length_value is not None and not pd.isna(length_value):
-            try:
-                length_mm = int(round(float(length_value)))
-            except Exception:
-                length_mm = None
-        if length_mm is None or length_mm <= 0:
-            length_mm = parse_length_to_mm(row.get("Length profile"))
-        if length_mm is None or length_mm <= 0:
-            continue
-        key = (profile_name, material_name, production_name)
+    if bom_df.empty:
+        return stats
+
+    def column(name: str) -> pd.Series:
+        # Ontbrekende kolom gedraagt zich als row.get(...) -> None
+        if name in bom_df.columns:
+            return bom_df[name]
+        return pd.Series([None] * len(bom_df), index=bom_df.index, dtype=object)
+
+    profile = column("Profile").map(_to_clean_str)
+    material = pd.Series(
+        [
+            _to_clean_str(primary or alternative)
+            for primary, alternative in zip(column("Materiaal"), column("Material"))
+        ],
+        index=bom_df.index,
+        dtype=object,
+    )
+    production = column("Production").map(_to_clean_str).replace("", "_Onbekend")
+    weight_each = column("Gewicht").map(_parse_weight_kg).astype(float)
+    qty = column("Aantal").map(_parse_int_or_zero)
+
+    # Lengte in mm: eerst de numerieke kolom, anders de tekstkolom parsen
+    length_mm = column("Length profile mm").map(_round_mm_or_none).astype(float)
+    fallback = ~(length_mm > 0) & (profile != "")
+    if fallback.any():
+        parsed = parse_lengths_to_mm(column("Length profile")[fallback])
+        length_mm.loc[fallback] = parsed.astype(float).to_numpy()
+
+    mask = (profile != "") & (weight_each > 0) & (qty > 0) & (length_mm > 0)
+    if not mask.any():
+        return stats
+    work = pd.DataFrame(
+        {
+            "profile": profile[mask],
+            "material": material[mask],
+            "production": production[mask],
+            "length": length_mm[mask] * qty[mask],
+            "weight": weight_each[mask] * qty[mask],
+        }
+    )
+    grouped = work.groupby(["profile", "material", "production"], sort=False)[
+        ["length", "weight"]
+    ].sum()
+    for key, total_length, total_weight in grouped.itertuples(name=None):
         entry = stats[key]
-        entry.total_length_mm += float(length_mm) * qty
-        entry.total_weight_kg += float(weight_each) * qty
+        entry.total_length_mm = float(total_length)
+        entry.total_weight_kg = float(total_weight)
     return stats
 
 
+def _parse_int_or_zero(value: object) -> int:
+    try:
+        return int(float(value))
+    except Exception:
+        return 0
+
+
+def _round_mm_or_none(value: object) -> float | None:
+    if value is None or pd.isna(value):
+        return None
+    try:
+        return int(round(float(value)))
+    except Exception:
+        return None
+
+
 def _format_weight_kg(value: float | None) -> str:
     if value is None:
         return ""
@@ -854,14 +1027,26 @@ def compute_opticutter_order_details(
     return details
 
 
-def describe_finish_combo(
-    finish_value: object,
-    ral_value: object,
-) -> Dict[str, str]:
-    """Return normalized metadata for a finish/RAL combination."""
+_FINISH_COMBO_FIELDS = (
+    "finish_display",
+    "finish_norm",
+    "ral_display",
+    "ral_norm",
+    "folder_name",
+    "label",
+    "filename_component",
+    "key",
+)
+
+
+@lru_cache(maxsize=1024)
+def _finish_combo_fields(finish_text: str, ral_text: str) -> Tuple[str, ...]:
+    """Bereken de velden van :func:`describe_finish_combo` (gecachet).
+
+    GUI en CLI vragen dezelfde handvol combinaties per BOM-rij op; het
+    normaliseren (unicodedata + regexen) gebeurt zo maar één keer per combo.
+    """
 
-    finish_text = _to_str(finish_value).strip()
-    ral_text = _to_str(ral_value).strip()
     finish_norm = _normalize_finish_folder(finish_text)
     if not finish_norm:
         finish_norm = "_Onbekend"
@@ -878,16 +1063,33 @@ def describe_finish_combo(
     if not filename_component:
         suffix = f"-{ral_norm}" if ral_norm else ""
         filename_component = f"{finish_norm}{suffix}"
-    return {
-        "finish_display": finish_display,
-        "finish_norm": finish_norm,
-        "ral_display": ral_display,
-        "ral_norm": ral_norm,
-        "folder_name": folder_name,
-        "label": label,
-        "filename_component": filename_component,
-        "key": folder_name,
-    }
+    return (
+        finish_display,
+        finish_norm,
+        ral_display,
+        ral_norm,
+        folder_name,
+        label,
+        filename_component,
+        folder_name,
+    )
+
+
+def describe_finish_combo(
+    finish_value: object,
+    ral_value: object,
+) -> Dict[str, str]:
+    """Return normalized metadata for a finish/RAL combination."""
+
+    # Steeds een nieuwe dict zodat aanroepers het resultaat mogen aanpassen
+    return dict(
+        zip(
+            _FINISH_COMBO_FIELDS,
+            _finish_combo_fields(
+                _to_clean_str(finish_value), _to_clean_str(ral_value)
+            ),
+        )
+    )
 
 
 def generate_pdf_order_platypus(
@@ -939,9 +1141,9 @@ def generate_pdf_order_platypus(
     text_style.leading = 13
     small_style = ParagraphStyle("small", parent=text_style, fontSize=8.5, leading=10.5)
 
-    doc_type_text = (_to_str(doc_type).strip() or "Bestelbon")
+    doc_type_text = (_to_clean_str(doc_type) or "Bestelbon")
     doc_type_text_lower = doc_type_text.lower()
-    doc_type_text_slug = re.sub(r"[^0-9a-z]+", "", doc_type_text_lower)
+    doc_type_text_slug = _DOC_TYPE_SLUG_RE.sub("", doc_type_text_lower)
     is_standaard_doc = doc_type_text_lower.startswith("standaard")
     order_remark_text = _to_str(order_remark) if order_remark is not None else ""
     order_remark_has_content = bool(order_remark_text.strip())
@@ -1023,17 +1225,7 @@ def generate_pdf_order_platypus(
 
     supp_lines: List[str] = []
     if supplier is not None and not is_standaard_doc:
-        addr_parts = []
-        if supplier.adres_1:
-            addr_parts.append(supplier.adres_1)
-        if supplier.adres_2:
-            addr_parts.append(supplier.adres_2)
-        pc_gem = " ".join(x for x in [supplier.postcode, supplier.gemeente] if x)
-        if pc_gem:
-            addr_parts.append(pc_gem)
-        if supplier.land:
-            addr_parts.append(supplier.land)
-        full_addr = ", ".join(addr_parts)
+        full_addr = _format_supplier_address(supplier)
 
         supp_lines = [f"<b>Besteld bij:</b> {supplier.supplier}"]
         if full_addr:
@@ -1107,7 +1299,7 @@ def generate_pdf_order_platypus(
     if custom_layout:
         head = []
         for column in column_layout:
-            header = _to_str(column.get("label") or column.get("key") or "").strip()
+            header = _to_clean_str(column.get("label") or column.get("key") or "")
             if not header:
                 header = column.get("key", "")
             column["label"] = header
@@ -1117,17 +1309,33 @@ def generate_pdf_order_platypus(
     else:
         head = ["PartNumber", "Omschrijving", "Materiaal", "St.", "m²", "kg"]
 
+    # Stijlen en identieke cellen hergebruiken: ReportLab wrapt een flowable
+    # opnieuw vlak voor het tekenen, dus gedeelde Paragraphs zijn veilig.
+    cell_styles: Dict[tuple[bool, str], ParagraphStyle] = {}
+    cell_cache: Dict[tuple[str, bool, str], Paragraph] = {}
+
     def wrap_cell_html(val: str, small=False, align=None):
-        style = ParagraphStyle(
-            "cellsmall" if small else "cell",
-            fontName="Helvetica",
-            fontSize=8.5 if small else 9,
-            leading=10.5 if small else 11,
-            wordWrap="CJK",
-        )
-        if align:
-            style.alignment = {"LEFT": 0, "CENTER": 1, "RIGHT": 2}.get(align.upper(), 0)
-        return Paragraph(str(val if (val is not None) else ""), style)
+        align_key = align.upper() if align else ""
+        text = str(val if (val is not None) else "")
+        cache_key = (text, bool(small), align_key)
+        para = cell_cache.get(cache_key)
+        if para is not None:
+            return para
+        style = cell_styles.get((bool(small), align_key))
+        if style is None:
+            style = ParagraphStyle(
+                "cellsmall" if small else "cell",
+                fontName="Helvetica",
+                fontSize=8.5 if small else 9,
+                leading=10.5 if small else 11,
+                wordWrap="CJK",
+            )
+            if align_key:
+                style.alignment = {"LEFT": 0, "CENTER": 1, "RIGHT": 2}.get(align_key, 0)
+            cell_styles[(bool(small), align_key)] = style
+        para = Paragraph(text, style)
+        cell_cache[cache_key] = para
+        return para
 
     data = [head]
     total_row_index: int | None = None
@@ -1151,7 +1359,7 @@ def generate_pdf_order_platypus(
                 else:
                     value = _to_str(value)
                     small = False
-                align = _to_str(column.get("justify") or "left").strip().upper() or "LEFT"
+                align = _to_clean_str(column.get("justify") or "left").upper() or "LEFT"
                 if align not in {"LEFT", "RIGHT", "CENTER"}:
                     align = "LEFT"
                 row_cells.append(wrap_cell_html(value, small=small, align=align))
@@ -1160,7 +1368,7 @@ def generate_pdf_order_platypus(
         if weight_idx is not None and total_weight_kg is not None:
             total_row: List[Paragraph] = []
             for idx, column in enumerate(column_layout):
-                align = _to_str(column.get("justify") or "left").strip().upper() or "LEFT"
+                align = _to_clean_str(column.get("justify") or "left").upper() or "LEFT"
                 if align not in {"LEFT", "RIGHT", "CENTER"}:
                     align = "LEFT"
                 if idx == weight_idx:
@@ -1184,13 +1392,15 @@ def generate_pdf_order_platypus(
             qty = _to_str("" if qty_val in (None, "") else qty_val)
             weight_val = it.get("kg", "")
             weight = _num_to_2dec(weight_val)
+            # Korte numerieke cellen als platte tekst: geen Paragraph-opmaak
+            # nodig, lettertype en uitlijning komen uit de TableStyle.
             data.append(
                 [
                     wrap_cell_html(prof, small=False, align="LEFT"),
                     wrap_cell_html(mat, small=False, align="LEFT"),
-                    wrap_cell_html(length, small=True, align="RIGHT"),
-                    wrap_cell_html(qty, small=True, align="RIGHT"),
-                    wrap_cell_html(weight, small=True, align="RIGHT"),
+                    length,
+                    qty,
+                    weight,
                 ]
             )
         if total_weight_kg is not None:
@@ -1209,7 +1419,8 @@ def generate_pdf_order_platypus(
             pn = _pn_wrap_25(it.get("PartNumber", ""))
             desc = _to_str(it.get("Description", ""))
             mat = _material_nowrap(it.get("Materiaal", ""))
-            qty = it.get("Aantal", "")
+            qty_val = it.get("Aantal", "")
+            qty = str(qty_val if qty_val is not None else "")
             opp = _num_to_2dec(it.get("Oppervlakte", ""))
             gew = _num_to_2dec(it.get("Gewicht", ""))
             data.append(
@@ -1217,9 +1428,9 @@ def generate_pdf_order_platypus(
                     wrap_cell_html(pn, small=False, align="LEFT"),
                     wrap_cell_html(desc, small=False, align="LEFT"),
                     wrap_cell_html(mat, small=True, align="RIGHT"),
-                    wrap_cell_html(qty, small=True, align="RIGHT"),
-                    wrap_cell_html(opp, small=True, align="RIGHT"),
-                    wrap_cell_html(gew, small=True, align="RIGHT"),
+                    qty,
+                    opp,
+                    gew,
                 ]
             )
 
@@ -1243,12 +1454,12 @@ def generate_pdf_order_platypus(
         mat_w = usable_w * col_fracs[2]
         try:
             header_width = stringWidth("Materiaal", "Helvetica-Bold", 10) + 6
+            # Materialen herhalen zich sterk; meet elke waarde maar één keer.
+            materials = {it.get("Materiaal", "") for it in items}
             value_width = (
                 max(
-                    stringWidth(
-                        _material_nowrap(it.get("Materiaal", "")), "Helvetica", 9
-                    )
-                    for it in items
+                    stringWidth(_material_nowrap(mat), "Helvetica", 9)
+                    for mat in materials
                 )
                 + 6
             )
@@ -1291,17 +1502,27 @@ def generate_pdf_order_platypus(
     ]
     if custom_layout and column_layout:
         for idx, column in enumerate(column_layout):
-            align = _to_str(column.get("justify") or "left").strip().upper() or "LEFT"
+            align = _to_clean_str(column.get("justify") or "left").upper() or "LEFT"
             if align not in {"LEFT", "RIGHT", "CENTER"}:
                 align = "LEFT"
             style_cmds.append(("ALIGN", (idx, 0), (idx, -1), align))
     elif is_raw_material_order:
-        style_cmds.append(("ALIGN", (2, 0), (4, -1), "RIGHT"))
+        style_cmds.extend(
+            [
+                ("ALIGN", (2, 0), (4, -1), "RIGHT"),
+                ("FONTNAME", (2, 1), (4, -1), "Helvetica"),
+                ("FONTSIZE", (2, 1), (4, -1), 8.5),
+                ("LEADING", (2, 1), (4, -1), 10.5),
+            ]
+        )
     else:
         style_cmds.extend(
             [
                 ("ALIGN", (2, 0), (5, 0), "RIGHT"),
                 ("ALIGN", (2, 1), (5, -1), "RIGHT"),
+                ("FONTNAME", (3, 1), (5, -1), "Helvetica"),
+                ("FONTSIZE", (3, 1), (5, -1), 8.5),
+                ("LEADING", (3, 1), (5, -1), 10.5),
             ]
         )
     if total_row_index is not None:
@@ -1408,6 +1629,178 @@ def generate_packlist_pdf(
     return True
 
 
+# Vanaf dit aantal regels schrijft write_order_excel de xlsx zelf weg; de
+# per-cel overhead van pandas/openpyxl domineert dan de exporttijd.
+_RAW_XLSX_MIN_ITEMS = 500
+
+_XLSX_INVALID_CHARS = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+_XLSX_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    '<Override PartName="/xl/styles.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+    "</Types>"
+)
+_XLSX_ROOT_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>'
+    "</Relationships>"
+)
+_XLSX_WORKBOOK = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    '<sheets><sheet name="Sheet1" sheetId="1" r:id="rId1"/></sheets>'
+    "</workbook>"
+)
+_XLSX_WORKBOOK_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" Target="worksheets/sheet1.xml"/>'
+    '<Relationship Id="rId2" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" Target="styles.xml"/>'
+    "</Relationships>"
+)
+# Celstijlen: 0 standaard, 1-4 (links/rechts) x (zonder/met terugloop),
+# 5 vetgedrukte notitie links met terugloop.
+_XLSX_STYLES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    '<fonts count="2">'
+    '<font><sz val="11"/><name val="Calibri"/><family val="2"/></font>'
+    '<font><b/><sz val="11"/><name val="Calibri"/><family val="2"/></font>'
+    "</fonts>"
+    '<fills count="2"><fill><patternFill patternType="none"/></fill>'
+    '<fill><patternFill patternType="gray125"/></fill></fills>'
+    '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+    '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+    '<cellXfs count="6">'
+    '<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+    '<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0" applyAlignment="1"><alignment horizontal="left"/></xf>'
+    '<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0" applyAlignment="1"><alignment horizontal="left" wrapText="1"/></xf>'
+    '<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0" applyAlignment="1"><alignment horizontal="right"/></xf>'
+    '<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0" applyAlignment="1"><alignment horizontal="right" wrapText="1"/></xf>'
+    '<xf numFmtId="0" fontId="1" fillId="0" borderId="0" xfId="0" applyFont="1" applyAlignment="1"><alignment horizontal="left" wrapText="1"/></xf>'
+    "</cellXfs>"
+    '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+    "</styleSheet>"
+)
+_XLSX_NOTE_STYLE = 5
+
+
+def _xlsx_column_letter(idx: int) -> str:
+    """Return the spreadsheet column letter for a 1-based column index."""
+    letters = ""
+    while idx:
+        idx, rem = divmod(idx - 1, 26)
+        letters = chr(65 + rem) + letters
+    return letters
+
+
+def _xlsx_cell(ref: str, value: object, style: int) -> str:
+    """Serialise één cel; lege waarden leveren een lege string op."""
+    if value is None or value == "":
+        return ""
+    s_attr = f' s="{style}"' if style else ""
+    if isinstance(value, bool):
+        return f'<c r="{ref}"{s_attr} t="b"><v>{int(value)}</v></c>'
+    if isinstance(value, numbers.Real):
+        number = value.item() if hasattr(value, "item") else value
+        if isinstance(number, float) and not math.isfinite(number):
+            return ""
+        return f'<c r="{ref}"{s_attr}><v>{number!r}</v></c>'
+    text = _XLSX_INVALID_CHARS.sub("", str(value))
+    return (
+        f'<c r="{ref}"{s_attr} t="inlineStr"><is>'
+        f'<t xml:space="preserve">{xml_escape(text)}</t></is></c>'
+    )
+
+
+def _write_xlsx_raw(
+    path: str,
+    header_lines: Sequence[Tuple[str, str]],
+    df: pd.DataFrame,
+    *,
+    left_cols: set,
+    wrap_cols: set,
+    wide_cols: set,
+    note_text: str | None = None,
+) -> None:
+    """Write ``header_lines`` and ``df`` as a minimal xlsx package.
+
+    Produces the same cells and alignment as the library-based writers in
+    :func:`write_order_excel` without creating a Python object per cell.
+    """
+    letters = [_xlsx_column_letter(i) for i in range(1, max(len(df.columns), 2) + 1)]
+    styles = [
+        1 + (0 if col in left_cols else 2) + (1 if col in wrap_cols else 0)
+        for col in df.columns
+    ]
+
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("[Content_Types].xml", _XLSX_CONTENT_TYPES)
+        zf.writestr("_rels/.rels", _XLSX_ROOT_RELS)
+        zf.writestr("xl/workbook.xml", _XLSX_WORKBOOK)
+        zf.writestr("xl/_rels/workbook.xml.rels", _XLSX_WORKBOOK_RELS)
+        zf.writestr("xl/styles.xml", _XLSX_STYLES)
+        with zf.open("xl/worksheets/sheet1.xml", "w") as raw:
+            out = io.TextIOWrapper(raw, encoding="utf-8")
+            out.write(
+                '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+                '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+            )
+            wide = [i for i, col in enumerate(df.columns, start=1) if col in wide_cols]
+            if wide:
+                out.write("<cols>")
+                for i in wide:
+                    out.write(f'<col min="{i}" max="{i}" width="25" customWidth="1"/>')
+                out.write("</cols>")
+            out.write("<sheetData>")
+
+            r = 0
+            for label, value in header_lines:
+                r += 1
+                out.write(
+                    f'<row r="{r}">{_xlsx_cell(f"A{r}", label, 0)}'
+                    f'{_xlsx_cell(f"B{r}", value, 0)}</row>'
+                )
+
+            r += 1
+            out.write(f'<row r="{r}">')
+            out.write(
+                "".join(
+                    _xlsx_cell(f"{letter}{r}", col, style)
+                    for letter, col, style in zip(letters, df.columns, styles)
+                )
+            )
+            out.write("</row>")
+
+            body = df.astype(object).where(df.notna(), None)
+            for values in body.itertuples(index=False, name=None):
+                r += 1
+                out.write(f'<row r="{r}">')
+                out.write(
+                    "".join(
+                        _xlsx_cell(f"{letter}{r}", value, style)
+                        for letter, value, style in zip(letters, values, styles)
+                    )
+                )
+                out.write("</row>")
+
+            if note_text:
+                r += 2
+                out.write(
+                    f'<row r="{r}">{_xlsx_cell(f"A{r}", note_text, _XLSX_NOTE_STYLE)}</row>'
+                )
+            out.write("</sheetData></worksheet>")
+            out.flush()
+            out.detach()
+
+
 def write_order_excel(
     path: str,
     items: List[Dict[str, object]],
@@ -1434,7 +1827,7 @@ def write_order_excel(
     if custom_layout:
         headers: List[str] = []
         for column in column_layout:
-            header = _to_str(column.get("label") or column.get("key") or "").strip()
+            header = _to_clean_str(column.get("label") or column.get("key") or "")
             if not header:
                 header = column.get("key", "")
             column["label"] = header
@@ -1491,9 +1884,9 @@ def write_order_excel(
             [df, pd.DataFrame([blank_row, note_row])], ignore_index=True
         )
 
-    doc_type_text = (_to_str(doc_type).strip() or "Bestelbon")
+    doc_type_text = (_to_clean_str(doc_type) or "Bestelbon")
     doc_type_text_lower = doc_type_text.lower()
-    doc_type_text_slug = re.sub(r"[^0-9a-z]+", "", doc_type_text_lower)
+    doc_type_text_slug = _DOC_TYPE_SLUG_RE.sub("", doc_type_text_lower)
     is_standaard_doc = doc_type_text_lower.startswith("standaard")
     order_remark_text = _to_str(order_remark) if order_remark is not None else ""
     order_remark_has_content = bool(order_remark_text.strip())
@@ -1528,22 +1921,12 @@ def write_order_excel(
                 ("", ""),
             ]
         )
-    supplier_name = _to_str(supplier.supplier).strip() if supplier else ""
+    supplier_name = _to_clean_str(supplier.supplier) if supplier else ""
     include_supplier_block = supplier is not None and (
         not is_standaard_doc or bool(supplier_name)
     )
     if include_supplier_block:
-        addr_parts = []
-        if supplier.adres_1:
-            addr_parts.append(supplier.adres_1)
-        if supplier.adres_2:
-            addr_parts.append(supplier.adres_2)
-        pc_gem = " ".join(x for x in [supplier.postcode, supplier.gemeente] if x)
-        if pc_gem:
-            addr_parts.append(pc_gem)
-        if supplier.land:
-            addr_parts.append(supplier.land)
-        full_addr = ", ".join(addr_parts)
+        full_addr = _format_supplier_address(supplier)
         header_lines.extend(
             [
                 ("Leverancier", supplier.supplier),
@@ -1557,7 +1940,7 @@ def write_order_excel(
     include_delivery_block = False
     if delivery is not None:
         delivery_has_content = any(
-            _to_str(value).strip()
+            _to_clean_str(value)
             for value in (delivery.name, delivery.address, delivery.remarks)
         )
         include_delivery_block = (
@@ -1582,56 +1965,167 @@ def write_order_excel(
         header_lines.append(("", ""))
 
     startrow = len(header_lines)
-    if Alignment is not None and hasattr(pd, "ExcelWriter"):
-        with pd.ExcelWriter(path, engine="openpyxl") as writer:
-            df.to_excel(writer, index=False, startrow=startrow)
-            ws = writer.sheets[list(writer.sheets.keys())[0]]
-            for r, (label, value) in enumerate(header_lines, start=1):
-                ws.cell(row=r, column=1, value=label)
-                ws.cell(row=r, column=2, value=value)
-
-            if custom_layout:
-                left_cols = {
-                    _to_str(column.get("label") or column.get("key") or "").strip()
-                    or column.get("key", "")
-                    for column in column_layout
-                    if _to_str(column.get("justify") or "left").strip().lower() != "right"
-                }
-                wrap_cols = {
-                    _to_str(column.get("label") or column.get("key") or "").strip()
-                    or column.get("key", "")
-                    for column in column_layout
-                    if bool(column.get("wrap"))
+    if custom_layout:
+        left_cols = {
+            _to_clean_str(column.get("label") or column.get("key") or "")
+            or column.get("key", "")
+            for column in column_layout
+            if _to_clean_str(column.get("justify") or "left").lower() != "right"
+        }
+        wrap_cols = {
+            _to_clean_str(column.get("label") or column.get("key") or "")
+            or column.get("key", "")
+            for column in column_layout
+            if bool(column.get("wrap"))
+        }
+        wide_cols: set = set()
+    else:
+        if is_raw_material_order:
+            left_cols = {"Profiel", "Materiaal"}
+            wrap_cols = {"Profiel", "Materiaal"}
+        else:
+            left_cols = {"PartNumber", "Description"}
+            wrap_cols = {"PartNumber", "Description"}
+        wide_cols = {"PartNumber", "Profiel"}
+    write_note = bool(en1090_required and note_text and not append_note_to_df)
+
+    if len(items) > _RAW_XLSX_MIN_ITEMS:
+        _write_xlsx_raw(
+            path,
+            header_lines,
+            df,
+            left_cols=left_cols,
+            wrap_cols=wrap_cols,
+            wide_cols=wide_cols,
+            note_text=note_text if write_note else None,
+        )
+    elif XLSXWRITER_OK and hasattr(pd, "ExcelWriter"):
+        # xlsxwriter schrijft sneller; cellen kunnen achteraf niet meer
+        # opgemaakt worden, dus alle opmaak gaat via kolom- en celformaten.
+        with pd.ExcelWriter(path, engine="xlsxwriter") as writer:
+            df.to_excel(writer, sheet_name="Sheet1", index=False, startrow=startrow)
+            book = writer.book
+            ws = writer.sheets["Sheet1"]
+            # Expliciet standaardformaat, anders erven de kopregels het
+            # kolomformaat van de tabel.
+            plain_fmt = book.add_format()
+            for r, (label, value) in enumerate(header_lines):
+                ws.write(r, 0, label, plain_fmt)
+                ws.write(r, 1, value, plain_fmt)
+            for col_idx, col_name in enumerate(df.columns):
+                align = {
+                    "align": "left" if col_name in left_cols else "right",
+                    "text_wrap": col_name in wrap_cols,
                 }
-            else:
-                if is_raw_material_order:
-                    left_cols = {"Profiel", "Materiaal"}
-                    wrap_cols = {"Profiel", "Materiaal"}
-                else:
-                    left_cols = {"PartNumber", "Description"}
-                    wrap_cols = {"PartNumber", "Description"}
-            for col_idx, col_name in enumerate(df.columns, start=1):
-                align = Alignment(
-                    horizontal="left" if col_name in left_cols else "right",
-                    wrap_text=col_name in wrap_cols,
+                width = 25 if col_name in wide_cols else None
+                col_fmt = book.add_format(align)
+                ws.set_column(col_idx, col_idx, width, col_fmt)
+                ws.write(startrow, col_idx, col_name, col_fmt)
+            if write_note:
+                ws.write(
+                    startrow + len(df) + 2,
+                    0,
+                    note_text,
+                    book.add_format({"bold": True, "align": "left", "text_wrap": True}),
                 )
-                if (
-                    not custom_layout
-                    and col_name in {"PartNumber", "Profiel"}
-                    and get_column_letter is not None
-                ):
-                    column_letter = get_column_letter(col_idx)
-                    ws.column_dimensions[column_letter].width = 25
-                for row in range(startrow + 1, startrow + len(df) + 2):
-                    ws.cell(row=row, column=col_idx).alignment = align
+    elif Alignment is not None and Workbook is not None:
+        # write_only streamt de rijen rechtstreeks naar het zipbestand in
+        # plaats van elke cel als object in het geheugen te houden.
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet("Sheet1")
+        aligns = [
+            Alignment(
+                horizontal="left" if col_name in left_cols else "right",
+                wrap_text=col_name in wrap_cols,
+            )
+            for col_name in df.columns
+        ]
+        for col_idx, col_name in enumerate(df.columns, start=1):
+            if col_name in wide_cols:
+                ws.column_dimensions[get_column_letter(col_idx)].width = 25
+        for label, value in header_lines:
+            ws.append((label, value))
+
+        header_row = []
+        for col_name, align in zip(df.columns, aligns):
+            cell = WriteOnlyCell(ws, value=col_name)
+            cell.alignment = align
+            header_row.append(cell)
+        ws.append(header_row)
+
+        body = df.astype(object).where(df.notna(), None)
+        for values in body.itertuples(index=False, name=None):
+            row_cells = []
+            for value, align in zip(values, aligns):
+                cell = WriteOnlyCell(ws, value=value)
+                cell.alignment = align
+                row_cells.append(cell)
+            ws.append(row_cells)
+
+        if write_note:
+            ws.append(())
+            cell = WriteOnlyCell(ws, value=note_text)
+            cell.font = Font(bold=True)
+            cell.alignment = Alignment(horizontal="left", wrap_text=True)
+            ws.append((cell,))
+        wb.save(path)
+
+
+def _pdf_order_worker(job: Tuple[tuple, Dict[str, object]]) -> str | None:
+    """Render one order PDF in a worker process; return the error text."""
+
+    args, kwargs = job
+    try:
+        generate_pdf_order_platypus(*args, **kwargs)
+    except Exception as exc:
+        return str(exc)
+    return None
+
 
-            if en1090_required and note_text and not append_note_to_df:
-                note_row = ws.max_row + 2
-                cell = ws.cell(row=note_row, column=1, value=note_text)
-                if Font is not None:
-                    cell.font = Font(bold=True)
-                if Alignment is not None:
-                    cell.alignment = Alignment(horizontal="left", wrap_text=True)
+def _run_production_pdf_jobs(jobs: Sequence[Tuple[str, tuple, Dict[str, object]]]) -> None:
+    """Render the per-production order PDFs.
+
+    PDF-opmaak is CPU-gebonden en producties zijn onafhankelijk: bij meerdere
+    grote bestelbonnen verdelen we ze over processen. Kleine runs blijven
+    sequentieel, want een werkproces opstarten (pandas + ReportLab importeren)
+    kost meer dan het oplevert.
+    """
+
+    if not jobs:
+        return
+    total_items = sum(len(args[4]) for _prod, args, _kwargs in jobs)
+    errors: List[str | None] | None = None
+    if len(jobs) > 1 and total_items >= _PDF_PROCESS_MIN_ITEMS:
+        workers = min(len(jobs), os.cpu_count() or 1)
+        if workers > 1:
+            try:
+                # Altijd "spawn": de GUI draait dit in een thread, en een
+                # multithreaded Tk-proces forken kan vastlopen.
+                with ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                ) as pool:
+                    errors = list(
+                        pool.map(
+                            _pdf_order_worker,
+                            [(args, kwargs) for _prod, args, kwargs in jobs],
+                        )
+                    )
+            except Exception:
+                # Geen procespool beschikbaar: val terug op sequentieel.
+                errors = None
+    if errors is None:
+        errors = []
+        for _prod, args, kwargs in jobs:
+            try:
+                generate_pdf_order_platypus(*args, **kwargs)
+            except Exception as exc:
+                errors.append(str(exc))
+            else:
+                errors.append(None)
+    for (prod, _args, _kwargs), error in zip(jobs, errors):
+        if error is not None:
+            print(f"[WAARSCHUWING] PDF mislukt voor {prod}: {error}", file=sys.stderr)
 
 
 def pick_supplier_for_production(
@@ -1845,9 +2339,12 @@ def copy_per_production_and_orders(
     )
     os.makedirs(dest, exist_ok=True)
     file_index = _build_file_index(source, selected_exts)
+    # Eén keer genormaliseerd: per rij enkel nog strip/lower van de PartNumber
+    part_file_index = _normalize_file_index(file_index)
     selected_exts_set = {ext.lower() for ext in selected_exts}
     count_copied = 0
     chosen: Dict[str, str] = {}
+    defaults_changed = False
     doc_type_map = doc_type_map or {}
     doc_num_map = doc_num_map or {}
     finish_override_map = finish_override_map or {}
@@ -1859,20 +2356,20 @@ def copy_per_production_and_orders(
     opticutter_doc_num_map = opticutter_doc_num_map or {}
     opticutter_delivery_map = opticutter_delivery_map or {}
     opticutter_remarks_map = {
-        key: _to_str(value).strip()
+        key: _to_clean_str(value)
         for key, value in (opticutter_remarks_map or {}).items()
-        if _to_str(value).strip()
+        if _to_clean_str(value)
     }
     remarks_clean: Dict[str, str] = {}
     for key, value in (remarks_map or {}).items():
-        text = _to_str(value).strip()
+        text = _to_clean_str(value)
         if text:
             remarks_clean[key] = text
     remarks_map = remarks_clean
 
     finish_remarks_clean: Dict[str, str] = {}
     for key, value in (finish_remarks_map or {}).items():
-        text = _to_str(value).strip()
+        text = _to_clean_str(value)
         if text:
             finish_remarks_clean[key] = text
     finish_remarks_map = finish_remarks_clean
@@ -1880,7 +2377,7 @@ def copy_per_production_and_orders(
     def _clean_export_filter(values: Mapping[str, bool] | None) -> Dict[str, bool]:
         cleaned: Dict[str, bool] = {}
         for key, flag in (values or {}).items():
-            identifier = _to_str(key).strip()
+            identifier = _to_clean_str(key)
             if not identifier:
                 continue
             cleaned[identifier] = bool(flag)
@@ -1918,15 +2415,36 @@ def copy_per_production_and_orders(
     step_entries: Dict[str, List[tuple[str, str]]] = defaultdict(list)
     step_seen: Dict[str, set[str]] = defaultdict(set)
     finish_groups: Dict[str, Dict[str, object]] = {}
-    for _, row in bom_df.iterrows():
-        prod = (row.get("Production") or "").strip() or "_Onbekend"
+    # Eén records-conversie i.p.v. iterrows(); productie per kolom bepaald
+    bom_records = bom_df.to_dict(orient="records")
+    if "Production" in bom_df.columns:
+        prod_values = (
+            bom_df["Production"]
+            .fillna("")
+            .astype(str)
+            .str.strip()
+            .replace("", "_Onbekend")
+            .tolist()
+        )
+    else:
+        prod_values = ["_Onbekend"] * len(bom_records)
+    if "Aantal" in bom_df.columns:
+        qty_values = _parse_qty_series(bom_df["Aantal"]).tolist()
+    else:
+        qty_values = [1] * len(bom_records)
+    finish_meta_cache: Dict[tuple[object, object], Dict[str, str]] = {}
+    for row, prod, qty in zip(bom_records, prod_values, qty_values):
+        # Records zijn eigen kopieën: Aantal meteen als geparste int bewaren
+        row["Aantal"] = qty
         prod_to_rows[prod].append(row)
-        pn = _to_str(row.get("PartNumber")).strip()
-        finish_text = _to_str(row.get("Finish")).strip()
+        pn = _to_clean_str(row.get("PartNumber"))
+        finish_text = _to_clean_str(row.get("Finish"))
         if finish_text:
-            finish_meta = describe_finish_combo(
-                row.get("Finish"), row.get("RAL color")
-            )
+            finish_combo = (row.get("Finish"), row.get("RAL color"))
+            finish_meta = finish_meta_cache.get(finish_combo)
+            if finish_meta is None:
+                finish_meta = describe_finish_combo(*finish_combo)
+                finish_meta_cache[finish_combo] = finish_meta
             finish_key = finish_meta["key"]
             group = finish_groups.get(finish_key)
             if group is None:
@@ -1983,6 +2501,21 @@ def copy_per_production_and_orders(
 
     suppliers_sorted = db.suppliers_sorted()
 
+    # Zelfde PartNumber komt vaak in meerdere producties/afwerkingen voor:
+    # doelnaam en extensie per bronbestand maar één keer afleiden.
+    export_targets: Dict[str, Tuple[str, str]] = {}
+    files_for_part = part_file_index.get
+
+    def _export_target(src_file: str) -> Tuple[str, str]:
+        target = export_targets.get(src_file)
+        if target is None:
+            target = (
+                _transform_export_name(os.path.basename(src_file)),
+                os.path.splitext(src_file)[1].lower(),
+            )
+            export_targets[src_file] = target
+        return target
+
     def _record_path_warning(
         directory: str,
         requested: str,
@@ -2007,6 +2540,8 @@ def copy_per_production_and_orders(
         else _to_str(footer_note).replace("\r\n", "\n")
     )
 
+    # Bestelbon-PDF's per productie worden na de lus samen gerenderd.
+    production_pdf_jobs: List[Tuple[str, tuple, Dict[str, object]]] = []
     for prod, rows in prod_to_rows.items():
         if production_export_filter and not production_export_filter.get(prod, True):
             continue
@@ -2020,7 +2555,7 @@ def copy_per_production_and_orders(
             opticutter_comp = opticutter_details_map.get(prod)
 
         raw_doc_type = doc_type_map.get(prod, "Bestelbon")
-        doc_type = _to_str(raw_doc_type).strip() or "Bestelbon"
+        doc_type = _to_clean_str(raw_doc_type) or "Bestelbon"
         doc_num = _normalize_doc_number(doc_num_map.get(prod, ""), doc_type)
         prefix = _prefix_for_doc_type(doc_type)
         if doc_num and prefix and doc_num.upper() == prefix.upper():
@@ -2062,16 +2597,18 @@ def copy_per_production_and_orders(
                 )
 
         processed_pairs: set[tuple[str, str]] = set()
+        copy_jobs: Dict[str, str] = {}
         for row in rows:
             pn = str(row["PartNumber"])
-            files = file_index.get(pn, [])
+            files = files_for_part(pn.strip().lower())
+            if not files:
+                continue
             for src_file in files:
-                transformed = _transform_export_name(os.path.basename(src_file))
+                transformed, ext = _export_target(src_file)
                 combo = (src_file, transformed)
                 if combo in processed_pairs:
                     continue
                 processed_pairs.add(combo)
-                ext = os.path.splitext(src_file)[1].lower()
                 if selected_exts_set and ext not in selected_exts_set:
                     continue
                 if ext in STEP_EXTS:
@@ -2085,18 +2622,22 @@ def copy_per_production_and_orders(
                         zf.write(src_file, arcname=transformed)
                 else:
                     dst = os.path.join(prod_folder, transformed)
-                    shutil.copy2(src_file, dst)
+                    copy_jobs.pop(dst, None)
+                    copy_jobs[dst] = src_file
                 count_copied += 1
 
         if zf is not None:
             zf.close()
+        _copy_files(copy_jobs)
 
         supplier = pick_supplier_for_production(
             prod, db, override_map, suppliers_sorted=suppliers_sorted
         )
         chosen[make_production_selection_key(prod)] = supplier.supplier
         if remember_defaults and supplier.supplier not in ("", "Onbekend", NO_SUPPLIER_PLACEHOLDER):
-            db.set_default(prod, supplier.supplier)
+            if db.get_default(prod) != supplier.supplier:
+                db.set_default(prod, supplier.supplier)
+                defaults_changed = True
 
         en1090_required = should_require_en1090(prod, en1090_overrides)
         if not en1090_active:
@@ -2109,7 +2650,7 @@ def copy_per_production_and_orders(
                     "PartNumber": row.get("PartNumber", ""),
                     "Description": row.get("Description", ""),
                     "Materiaal": row.get("Materiaal", ""),
-                    "Aantal": _parse_qty(row.get("Aantal", "")),
+                    "Aantal": row["Aantal"],
                     "Oppervlakte": row.get("Oppervlakte", ""),
                     "Gewicht": row.get("Gewicht", ""),
                 }
@@ -2123,7 +2664,7 @@ def copy_per_production_and_orders(
             "logo_path": client.logo_path if client else "",
             "logo_crop": client.logo_crop if client else None,
         }
-        supplier_name_clean = _to_str(supplier.supplier).strip()
+        supplier_name_clean = _to_clean_str(supplier.supplier)
         delivery = delivery_map.get(prod)
         order_remark = (remarks_map.get(prod, "") if remarks_map else "").strip()
         supplier_for_docs: Supplier | None = supplier
@@ -2168,26 +2709,24 @@ def copy_per_production_and_orders(
                 context=f"Productie '{prod}' – {doc_type}",
             )
             pdf_path = os.path.join(prod_folder, pdf_filename)
-            try:
-                generate_pdf_order_platypus(
-                    pdf_path,
-                    company,
-                    supplier_for_docs,
+            production_pdf_jobs.append(
+                (
                     prod,
-                    items,
-                    doc_type=doc_type,
-                    doc_number=doc_num or None,
-                    footer_note=footer_note_text,
-                    delivery=delivery_for_docs,
-                    project_number=project_number,
-                    project_name=project_name,
-                    label_kind="productie",
-                    order_remark=order_remark or None,
-                    en1090_required=en1090_required,
-                    en1090_note=en1090_note_text,
+                    (pdf_path, company, supplier_for_docs, prod, items),
+                    dict(
+                        doc_type=doc_type,
+                        doc_number=doc_num or None,
+                        footer_note=footer_note_text,
+                        delivery=delivery_for_docs,
+                        project_number=project_number,
+                        project_name=project_name,
+                        label_kind="productie",
+                        order_remark=order_remark or None,
+                        en1090_required=en1090_required,
+                        en1090_note=en1090_note_text,
+                    ),
                 )
-            except Exception as e:
-                print(f"[WAARSCHUWING] PDF mislukt voor {prod}: {e}", file=sys.stderr)
+            )
 
         opticutter_order_items: List[Dict[str, object]] = []
         opticutter_total_weight: float | None = None
@@ -2280,13 +2819,14 @@ def copy_per_production_and_orders(
                 "Onbekend",
                 NO_SUPPLIER_PLACEHOLDER,
             ):
-                db.set_default(
-                    make_opticutter_default_key(prod), opticutter_supplier.supplier
-                )
+                opticutter_default_key = make_opticutter_default_key(prod)
+                if db.get_default(opticutter_default_key) != opticutter_supplier.supplier:
+                    db.set_default(opticutter_default_key, opticutter_supplier.supplier)
+                    defaults_changed = True
 
             opticutter_doc_type_raw = opticutter_doc_type_map.get(prod, "Bestelbon")
             opticutter_doc_type = (
-                _to_str(opticutter_doc_type_raw).strip() or "Bestelbon"
+                _to_clean_str(opticutter_doc_type_raw) or "Bestelbon"
             )
             opticutter_doc_num = _normalize_doc_number(
                 opticutter_doc_num_map.get(prod, ""), opticutter_doc_type
@@ -2319,7 +2859,7 @@ def copy_per_production_and_orders(
                 else:
                     opticutter_remark_text = weight_line
 
-            opticutter_supplier_name = _to_str(opticutter_supplier.supplier).strip()
+            opticutter_supplier_name = _to_clean_str(opticutter_supplier.supplier)
             supplier_for_opticutter_docs: Supplier | None = opticutter_supplier
             delivery_for_opticutter_docs = opticutter_delivery
             if opticutter_is_standaard and not opticutter_supplier_name:
@@ -2451,6 +2991,8 @@ def copy_per_production_and_orders(
                     file=sys.stderr,
                 )
 
+    _run_production_pdf_jobs(production_pdf_jobs)
+
     if copy_finish_exports and finish_groups:
         finish_seen: Dict[str, set[tuple[str, str]]] = defaultdict(set)
         for finish_key, info in finish_groups.items():
@@ -2463,6 +3005,7 @@ def copy_per_production_and_orders(
             target_dir = os.path.join(dest, folder_name)
             os.makedirs(target_dir, exist_ok=True)
             seen_pairs = finish_seen[finish_key]
+            copy_jobs = {}
             zf = None
             if zip_finish_exports:
                 zip_name = _fit_filename_within_path(
@@ -2493,23 +3036,27 @@ def copy_per_production_and_orders(
                         compression=zipfile.ZIP_STORED,
                     )
             for pn in sorted(part_numbers):
-                files = file_index.get(pn, [])
+                files = files_for_part(pn.lower())
+                if not files:
+                    continue
                 for src_file in files:
-                    transformed = _transform_export_name(os.path.basename(src_file))
+                    transformed, ext = _export_target(src_file)
                     combo = (src_file, transformed)
                     if combo in seen_pairs:
                         continue
                     seen_pairs.add(combo)
-                    ext = os.path.splitext(src_file)[1].lower()
                     if selected_exts_set and ext not in selected_exts_set:
                         continue
                     if zip_finish_exports:
                         if zf is not None:
                             zf.write(src_file, arcname=transformed)
                     else:
-                        shutil.copy2(src_file, os.path.join(target_dir, transformed))
+                        dst = os.path.join(target_dir, transformed)
+                        copy_jobs.pop(dst, None)
+                        copy_jobs[dst] = src_file
             if zf is not None:
                 zf.close()
+            _copy_files(copy_jobs)
 
     if finish_groups:
         for finish_key, info in sorted(
@@ -2525,14 +3072,16 @@ def copy_per_production_and_orders(
             )
             chosen[make_finish_selection_key(finish_key)] = supplier.supplier
             if remember_defaults and supplier.supplier not in ("", "Onbekend", NO_SUPPLIER_PLACEHOLDER):
-                db.set_default_finish(finish_key, supplier.supplier)
+                if db.get_default_finish(finish_key) != supplier.supplier:
+                    db.set_default_finish(finish_key, supplier.supplier)
+                    defaults_changed = True
 
             raw_doc_type = finish_doc_type_map.get(finish_key, "Bestelbon")
-            doc_type = _to_str(raw_doc_type).strip() or "Bestelbon"
+            doc_type = _to_clean_str(raw_doc_type) or "Bestelbon"
             doc_type_lower = doc_type.lower()
             is_standaard_doc = doc_type_lower.startswith("standaard")
 
-            supplier_name_clean = _to_str(supplier.supplier).strip()
+            supplier_name_clean = _to_clean_str(supplier.supplier)
             if not supplier_name_clean and not is_standaard_doc:
                 continue
 
@@ -2558,7 +3107,7 @@ def copy_per_production_and_orders(
                         "PartNumber": row.get("PartNumber", ""),
                         "Description": row.get("Description", ""),
                         "Materiaal": row.get("Materiaal", ""),
-                        "Aantal": _parse_qty(row.get("Aantal", "")),
+                        "Aantal": row["Aantal"],
                         "Oppervlakte": row.get("Oppervlakte", ""),
                         "Gewicht": row.get("Gewicht", ""),
                     }
@@ -2649,11 +3198,45 @@ def copy_per_production_and_orders(
             shutil.copy2(src_file, os.path.join(dest, transformed))
             count_copied += 1
 
-    db.save(SUPPLIERS_DB_FILE)
+    # Enkel wegschrijven als er effectief een standaardleverancier wijzigde.
+    if defaults_changed:
+        db.save(SUPPLIERS_DB_FILE)
 
     return count_copied, chosen
 
 
+def _merge_pdfs(sources: Sequence[object], out_path: str) -> None:
+    """Merge PDF ``sources`` (paths or binary file objects) into ``out_path``.
+
+    Met pikepdf worden pagina's als objecten overgenomen zonder de inhoud
+    opnieuw te parsen; anders valt het terug op PyPDF2's :class:`PdfMerger`.
+    """
+
+    if pikepdf is not None:
+        opened = []
+        try:
+            with pikepdf.Pdf.new() as merged:
+                for source in sources:
+                    pdf = pikepdf.Pdf.open(source)
+                    # Bron open houden tot na het opslaan: de pagina's
+                    # verwijzen nog naar haar objecten.
+                    opened.append(pdf)
+                    merged.pages.extend(pdf.pages)
+                merged.save(out_path)
+        finally:
+            for pdf in opened:
+                pdf.close()
+        return
+
+    merger = PdfMerger()
+    try:
+        for source in sources:
+            merger.append(source)
+        merger.write(out_path)
+    finally:
+        merger.close()
+
+
 def combine_pdfs_from_source(
     source: str,
     bom_df: pd.DataFrame,
@@ -2680,9 +3263,9 @@ def combine_pdfs_from_source(
     :class:`CombinedPdfResult` provides the number of generated files and the
     absolute output directory path.
     """
-    if PdfMerger is None:
+    if PdfMerger is None and pikepdf is None:
         raise ModuleNotFoundError(
-            "PyPDF2 must be installed to combine PDF files"
+            "PyPDF2 or pikepdf must be installed to combine PDF files"
         )
 
     date_str = date_str or datetime.date.today().strftime("%Y-%m-%d")
@@ -2727,20 +3310,18 @@ def combine_pdfs_from_source(
             candidates = list(files)
             if not candidates:
                 continue
-            merger = PdfMerger()
+            to_merge: List[str] = []
             appended: set[str] = set()
             for path in sorted(candidates, key=lambda x: os.path.basename(x).lower()):
                 if path in appended:
                     continue
-                merger.append(path)
+                to_merge.append(path)
                 appended.add(path)
-            if not appended:
-                merger.close()
+            if not to_merge:
                 continue
             out_name = f"{prod}_{date_str}_combined.pdf"
             safe_name = _fit_filename_within_path(out_dir, out_name)
-            merger.write(os.path.join(out_dir, safe_name))
-            merger.close()
+            _merge_pdfs(to_merge, os.path.join(out_dir, safe_name))
             count += 1
     else:
         ordered_files: List[str] = []
@@ -2755,7 +3336,6 @@ def combine_pdfs_from_source(
                     ordered_files.append(path)
                     seen.add(path)
         if ordered_files:
-            merger = PdfMerger()
             ordered_files.sort(key=lambda x: os.path.basename(x).lower())
             if related_bom_pdfs:
                 related_sorted = sorted(related_bom_pdfs, key=lambda x: os.path.basename(x).lower())
@@ -2763,12 +3343,9 @@ def combine_pdfs_from_source(
                 # Preserve related PDFs at the front by reordering ``ordered_files``.
                 rest = [path for path in ordered_files if path not in related_set]
                 ordered_files = related_sorted + rest
-            for path in ordered_files:
-                merger.append(path)
             out_name = f"BOM_{date_str}_combined.pdf"
             safe_name = _fit_filename_within_path(out_dir, out_name)
-            merger.write(os.path.join(out_dir, safe_name))
-            merger.close()
+            _merge_pdfs(ordered_files, os.path.join(out_dir, safe_name))
             count = 1
 
     return CombinedPdfResult(count=count, output_dir=out_dir)
@@ -2790,9 +3367,9 @@ def combine_pdfs_per_production(
     and current date. The returned :class:`CombinedPdfResult` provides the
     number of generated files and the absolute output directory path.
     """
-    if PdfMerger is None:
+    if PdfMerger is None and pikepdf is None:
         raise ModuleNotFoundError(
-            "PyPDF2 must be installed to combine PDF files"
+            "PyPDF2 or pikepdf must be installed to combine PDF files"
         )
 
     date_str = date_str or datetime.date.today().strftime("%Y-%m-%d")
@@ -2816,10 +3393,8 @@ def combine_pdfs_per_production(
             if f.lower().endswith(".pdf") and not f.startswith(("Bestelbon_", "Offerteaanvraag_"))
         ]
         if pdfs:
-            merger = PdfMerger()
             pdfs.sort(key=lambda x: x.lower())
-            for fname in pdfs:
-                merger.append(os.path.join(prod_path, fname))
+            sources: List[object] = [os.path.join(prod_path, fname) for fname in pdfs]
         else:
             zip_path = None
             prod_prefix = f"{prod}_"
@@ -2845,15 +3420,14 @@ def combine_pdfs_per_production(
                 ]
                 if not zip_pdfs:
                     continue
-                merger = PdfMerger()
+                sources = []
                 for name in sorted(
                     zip_pdfs, key=lambda x: os.path.basename(x).lower()
                 ):
                     with zf.open(name) as fh:
-                        merger.append(io.BytesIO(fh.read()))
+                        sources.append(io.BytesIO(fh.read()))
         out_name = f"{prod}_{date_str}_combined.pdf"
         safe_name = _fit_filename_within_path(out_dir, out_name)
-        merger.write(os.path.join(out_dir, safe_name))
-        merger.close()
+        _merge_pdfs(sources, os.path.join(out_dir, safe_name))
         count += 1
     return CombinedPdfResult(count=count, output_dir=out_dir)
@@ -5,7 +5,7 @@ from typing import List, Dict, Optional
 
 from models import Supplier
 from app_paths import data_file
-from helpers import favorite_prefix
+from helpers import favorite_prefix, json_loads
 
 SUPPLIERS_DB_FILE = data_file("suppliers_db.json")
 _FAVORITE_PREFIX = favorite_prefix()
@@ -27,18 +27,11 @@ class SuppliersDB:
         if not os.path.exists(path):
             return SuppliersDB()
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            with open(path, "rb") as f:
+                data = json_loads(f.read())
             if isinstance(data, list):  # backward compat
-                sups = [Supplier(supplier=s) for s in data]
-                return SuppliersDB(sups, {}, {})
-            sups_raw = data.get("suppliers", [])
-            sups = []
-            for rec in sups_raw:
-                try:
-                    sups.append(Supplier.from_any(rec))
-                except Exception:
-                    pass
+                return SuppliersDB(Supplier.from_records(data), {}, {})
+            sups = Supplier.from_records(data.get("suppliers", []))
             defaults = data.get("defaults_by_production", {}) or {}
             finish_defaults = data.get("defaults_by_finish", {}) or {}
             return SuppliersDB(sups, defaults, finish_defaults)
@@ -2,6 +2,7 @@ import datetime
 
 import pandas as pd
 
+import orders
 from models import Supplier
 from orders import copy_per_production_and_orders
 from suppliers_db import SuppliersDB
@@ -226,3 +227,21 @@ def test_related_exports_copied_next_to_bom(tmp_path, monkeypatch):
 
     assert cnt == 2
     assert (dest / f"{assembly_stem}.pdf").is_file()
+
+
+def test_bom_export_takes_first_filled_qty_alias(tmp_path):
+    df = pd.DataFrame(
+        {
+            "PartNumber": ["A", "B", "C", "D"],
+            "QTY.": ["", None, float("nan"), 4],
+            "Qty": [1, 2, "", None],
+            "Aantal": [9, 9, 9, 9],
+        }
+    )
+
+    path = orders._export_bom_workbook(df, str(tmp_path), "qty")
+
+    exported = pd.read_excel(path, dtype=object)
+    assert exported["QTY."].tolist() == [1, 2, 9, 4]
+    assert "Qty" not in exported.columns
+    assert "Aantal" not in exported.columns
@@ -56,3 +56,37 @@ def test_defaults_persist(tmp_path, monkeypatch):
     # Reload from disk and ensure defaults persisted
     db2 = SuppliersDB.load()
     assert db2.defaults_by_production == overrides
+
+
+def test_unchanged_defaults_skip_save(tmp_path, monkeypatch):
+    import orders
+
+    db_file = tmp_path / "suppliers.json"
+    monkeypatch.setattr(orders, "SUPPLIERS_DB_FILE", str(db_file))
+    db = SuppliersDB()
+    db.upsert(Supplier.from_any({"supplier": "ACME"}))
+
+    src = tmp_path / "src"
+    dst = tmp_path / "dst"
+    src.mkdir(); dst.mkdir()
+    (src / "PN1.pdf").write_text("dummy")
+    bom_df = pd.DataFrame([
+        {"PartNumber": "PN1", "Description": "", "Production": "Laser", "Aantal": 1},
+    ])
+
+    def run(remember):
+        copy_per_production_and_orders(
+            str(src), str(dst), bom_df, [".pdf"], db, {"Laser": "ACME"}, {}, {},
+            remember, client=None, delivery_map={},
+        )
+
+    run(False)
+    assert not db_file.exists()
+
+    run(True)
+    assert db_file.exists()
+    db_file.unlink()
+
+    # Zelfde standaard opnieuw onthouden: niets te schrijven
+    run(True)
+    assert not db_file.exists()
@@ -32,3 +32,16 @@ def test_cli_rename(monkeypatch, tmp_path):
     renamed = db2.get("New")
     assert renamed is not None
     assert renamed.address == "Street 1"
+
+
+def test_version_increments_on_mutation():
+    db = DeliveryAddressesDB([
+        DeliveryAddress(name="Old", address="Street 1"),
+    ])
+    assert db.version == 0
+    db.upsert(DeliveryAddress(name="New", address="Street 2"))
+    db.toggle_fav("New")
+    db.remove("Old")
+    assert db.version == 3
+    db.remove("Missing")
+    assert db.version == 3
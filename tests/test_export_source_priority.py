@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import pandas as pd
 
-from helpers import _build_file_index
+from helpers import _build_file_index, _normalize_file_index
 from models import Supplier
 from orders import copy_per_production_and_orders
 from suppliers_db import SuppliersDB
@@ -27,6 +27,17 @@ def test_file_index_prioritizes_non_bundle_sources(tmp_path):
     assert idx["PN1"][-1] == str(real)
 
 
+def test_normalized_file_index_is_case_insensitive(tmp_path):
+    src = tmp_path / "src"
+    (src / "sub").mkdir(parents=True)
+    (src / "PN1.pdf").write_text("a")
+    (src / "sub" / "pn1.pdf").write_text("b")
+
+    idx = _normalize_file_index(_build_file_index(str(src), [".pdf"]))
+    assert sorted(idx) == ["pn1"]
+    assert len(idx["pn1"]) == 2
+
+
 def test_copy_prefers_files_outside_bundle_directories(tmp_path):
     src = tmp_path / "src"
     dest = tmp_path / "dest"
@@ -60,3 +71,33 @@ def test_copy_prefers_files_outside_bundle_directories(tmp_path):
     assert cnt == 2
     exported = next((dest / "Laser").glob("*.pdf"))
     assert exported.read_text() == "new"
+
+
+def test_file_index_cache_tracks_subfolder_changes(tmp_path, monkeypatch):
+    import os
+
+    import helpers
+
+    src = tmp_path / "src"
+    sub = src / "sub"
+    sub.mkdir(parents=True)
+    (sub / "PN1.pdf").write_text("a")
+    for folder in (src, sub):
+        os.utime(folder, ns=(1_000_000_000, 1_000_000_000))
+
+    first = _build_file_index(str(src), [".pdf"])
+    assert first["PN1"] == [str(sub / "PN1.pdf")]
+
+    def _no_walk(*_args, **_kwargs):
+        raise AssertionError("index should come from the cache")
+
+    with monkeypatch.context() as m:
+        m.setattr(helpers.os, "walk", _no_walk)
+        second = _build_file_index(str(src), [".PDF"])
+    assert second == first
+    second["PN1"].append("mutated")
+
+    (sub / "PN2.pdf").write_text("b")
+    third = _build_file_index(str(src), [".pdf"])
+    assert sorted(third) == ["PN1", "PN2"]
+    assert third["PN1"] == [str(sub / "PN1.pdf")]
@@ -1,8 +1,9 @@
 import math
+import tkinter
 
 import pytest
 
-from manual_order_tab import _ensure_integer_quantity, ManualOrderTab
+from manual_order_tab import _ensure_integer_quantity, _sum_weights, ManualOrderTab
 
 
 @pytest.mark.parametrize(
@@ -55,3 +56,65 @@ def test_ensure_column_metrics_marks_integer_column():
     length_column = {"key": "Lengte", "numeric": True, "width": 10}
     ManualOrderTab._ensure_column_metrics(tab, length_column)
     assert "integer" not in length_column
+
+
+def test_sum_weights_skips_invalid_values():
+    assert _sum_weights(["1,5", " 2 ", "", "abc", ".5"]) == 4.0
+    assert _sum_weights(["", "x"]) is None
+
+
+def test_row_action_resolves_row_at_click_time():
+    tab = ManualOrderTab.__new__(ManualOrderTab)
+    first, second = object(), object()
+    tab.rows = [first, second]
+    tab._frame_to_row = {".rows.f1": first, ".rows.f2": second}
+    calls = []
+    tab._safe_delete_row = lambda idx: calls.append(("remove", idx))
+    tab._copy_row = lambda idx: calls.append(("copy", idx))
+    tab.add_row = lambda: calls.append(("add",))
+
+    ManualOrderTab._on_row_action(tab, "copy", ".rows.f2")
+    tab.rows.remove(first)  # indices verschuiven na verwijderen
+    ManualOrderTab._on_row_action(tab, "remove", ".rows.f2")
+    ManualOrderTab._on_row_action(tab, "remove", ".rows.gone")
+    ManualOrderTab._on_row_action(tab, "add", ".rows.f2")
+
+    assert calls == [("copy", 1), ("remove", 0), ("add",)]
+
+
+def test_row_vars_traced_for_price_format_and_weight_total(monkeypatch):
+    try:
+        interp = tkinter.Tcl()
+    except tkinter.TclError:
+        pytest.skip("Tcl niet beschikbaar")
+    monkeypatch.setattr(tkinter, "_default_root", interp)
+    tab = ManualOrderTab.__new__(ManualOrderTab)
+    tab.tk = interp.tk
+    tab._tclCommands = None
+    tab._var_trace_cmds = ManualOrderTab._register_var_trace_handlers(tab)
+    tab.current_columns = [
+        {"key": "Naam"},
+        {"key": "Gewicht", "total_weight": True},
+        {"key": "Eenheidsprijs"},
+    ]
+    tab.rows = []
+    tab._row_grid_indices = {}
+    tab._next_data_row = 1
+    tab._stringvar_pool = []
+    totals = []
+    tab._update_totals = lambda: totals.append(True)
+
+    row = tab._append_row_data({"Naam": "a", "Gewicht": "2", "Eenheidsprijs": "3,456"})
+    assert [var.get() for var in row.vars] == ["a", "2", "3.45"]
+    assert totals == []
+
+    row.vars[2].set("1,239")  # bv. plakken via het contextmenu
+    assert row.vars[2].get() == "1.23"
+    row.vars[1].set("5")
+    assert totals == [True]
+
+    tab._release_row_vars(row)
+    reused = tab._append_row_data()
+    reused.vars[1].set("1")
+    assert totals == [True, True]  # hergebruikte variabele: één trace
+
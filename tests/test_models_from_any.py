@@ -0,0 +1,99 @@
+import pandas as pd
+
+from models import Supplier
+
+
+def test_supplier_from_dataframe_matches_from_any():
+    df = pd.DataFrame(
+        [
+            {"Leverancier": " ACME ", "BTW": "BE0123456789", "Favoriet": "Ja", "City": "Gent"},
+            {"Leverancier": "-", "BTW": "", "Favoriet": "", "City": ""},
+            {"Leverancier": "Beta", "BTW": None, "Favoriet": "nee", "City": " "},
+        ]
+    )
+    suppliers = Supplier.from_dataframe(df)
+    assert [s.supplier for s in suppliers] == ["ACME", "Beta"]
+    acme, beta = suppliers
+    assert acme == Supplier.from_any(df.iloc[0].to_dict())
+    assert beta.btw is None
+    assert beta.gemeente is None
+    assert beta.favorite is False
+
+
+def test_supplier_csv_import_keeps_numeric_favorites(tmp_path):
+    from bom import read_csv_flex
+
+    path = tmp_path / "suppliers.csv"
+    path.write_text("Supplier,Favorite\nA,1\nB,0\nC,\n", encoding="utf-8")
+    df = read_csv_flex(str(path))
+    assert df["Favorite"].dtype.kind == "f"  # lege cel maakt de kolom float
+
+    suppliers = Supplier.from_dataframe(df)
+    assert [(s.supplier, s.favorite) for s in suppliers] == [
+        ("A", True),
+        ("B", False),
+        ("C", False),
+    ]
+
+
+def test_supplier_from_dataframe_mixed_favorite_cells():
+    df = pd.DataFrame(
+        {"Supplier": ["A", "B", "C", "D", "E"], "Favorite": ["Ja", 1.0, 0, None, " nee "]}
+    )
+    suppliers = Supplier.from_dataframe(df)
+    assert [s.favorite for s in suppliers] == [True, True, False, False, False]
+
+
+def test_supplier_from_dataframe_without_name_column():
+    df = pd.DataFrame([{"BTW": "BE0123456789"}])
+    assert Supplier.from_dataframe(df) == []
+
+
+def test_client_from_any_parses_crop_string():
+    from models import Client
+
+    client = Client.from_any({"name": "ACME", "logo_crop": "5; 10,105 ;210"})
+    assert client.logo_crop == {"left": 5, "top": 10, "right": 105, "bottom": 210}
+    assert Client.from_any({"name": "ACME", "logo_crop": "1,2,3"}).logo_crop is None
+
+
+def test_suppliers_db_load_accepts_list_and_dict(tmp_path):
+    from suppliers_db import SuppliersDB
+
+    path = tmp_path / "suppliers.json"
+    path.write_bytes(
+        b'{"suppliers": [{"supplier": "Acme", "favorite": true}, {"foo": 1}],'
+        b' "defaults_by_production": {"Laser": "Acme"}}'
+    )
+    db = SuppliersDB.load(str(path))
+    assert [s.supplier for s in db.suppliers] == ["Acme"]
+    assert db.suppliers[0].favorite is True
+    assert db.defaults_by_production == {"Laser": "Acme"}
+
+    path.write_bytes(b'["Beta"]')
+    assert [s.supplier for s in SuppliersDB.load(str(path)).suppliers] == ["Beta"]
+
+
+def test_from_any_returns_independent_instances():
+    rec = {"Supplier": "Acme", "BTW": "BE0123", "favoriet": "ja"}
+    first = Supplier.from_any(rec)
+    first.favorite = False
+    second = Supplier.from_any(dict(rec))
+    assert second is not first
+    assert second.favorite is True
+    assert second.btw == "BE0123"
+    assert Supplier.from_any({"supplier": "X", "phone": 1.0}).phone == "1.0"
+    assert Supplier.from_any({"supplier": "X", "phone": 1}).phone == "1"
+
+
+def test_supplier_from_any_accepts_pandas_na():
+    supplier = Supplier.from_any({"Supplier": "A", "BTW": pd.NA})
+    assert supplier.supplier == "A"
+    assert supplier.btw == "<NA>"  # zoals voorheen via _to_str
+
+
+def test_supplier_from_any_later_alias_wins():
+    rec = {"Supplier": "A", "mail": "a@x", "email": "b@x"}
+    assert Supplier.from_any(rec).sales_email == "b@x"
+    assert Supplier.from_any(dict(reversed(list(rec.items())))).sales_email == "a@x"
+
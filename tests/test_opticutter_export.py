@@ -119,3 +119,31 @@ def test_opticutter_files_written(tmp_path):
     assert not (
         prod1_dir / f"Bestelbon_brutemateriaal_Prod1_{today}.xlsx"
     ).exists(), "Overzichtsbestand Bestelbon_brutemateriaal zou niet mogen bestaan"
+
+
+def test_profile_stats_aggregate_per_profile_material_production():
+    from orders import _collect_opticutter_profile_stats
+
+    df = pd.DataFrame(
+        [
+            {"Profile": "U-80", "Materiaal": "Staal", "Production": "Zagen",
+             "Gewicht": "1,5 kg", "Aantal": 2, "Length profile mm": 1200},
+            {"Profile": "U-80", "Materiaal": "Staal", "Production": "Zagen",
+             "Gewicht": 2.0, "Aantal": "1", "Length profile mm": None,
+             "Length profile": "0,8 m"},
+            {"Profile": "U-80", "Materiaal": "", "Material": "S235",
+             "Production": "", "Gewicht": 1.0, "Aantal": 1,
+             "Length profile mm": 500},
+            {"Profile": "", "Materiaal": "Staal", "Production": "Zagen",
+             "Gewicht": 1.0, "Aantal": 1, "Length profile mm": 500},
+            {"Profile": "U-80", "Materiaal": "Staal", "Production": "Zagen",
+             "Gewicht": 1.0, "Aantal": "x", "Length profile mm": 500},
+        ]
+    )
+
+    stats = _collect_opticutter_profile_stats(df)
+    assert list(stats) == [("U-80", "Staal", "Zagen"), ("U-80", "S235", "_Onbekend")]
+    entry = stats[("U-80", "Staal", "Zagen")]
+    assert entry.total_length_mm == pytest.approx(2 * 1200 + 800)
+    assert entry.total_weight_kg == pytest.approx(2 * 1.5 + 2.0)
+    assert stats[("U-80", "S235", "_Onbekend")].total_length_mm == pytest.approx(500)
@@ -0,0 +1,34 @@
+import pandas as pd
+
+from opticutter import (
+    _calculate_stock_scenario,
+    parse_length_to_mm,
+    parse_lengths_to_mm,
+)
+
+
+def test_scenario_packs_and_drops_oversized():
+    result = _calculate_stock_scenario([2500, 2500, 1500, 7000, 0], 6000, 5.0)
+    assert result.bars == 2
+    assert result.dropped_pieces == 1
+    assert result.cuts == 1
+    assert result.waste_mm == 2 * 6000 - (2500 + 5 + 2500) - 1500
+
+
+def test_scenario_without_usable_lengths():
+    result = _calculate_stock_scenario([0, -5], 6000, 5.0)
+    assert (result.bars, result.dropped_pieces, result.cuts) == (0, 0, 0)
+
+
+def test_scenario_results_are_not_shared_between_calls():
+    first = _calculate_stock_scenario([1200, 800], 6000, 5.0)
+    second = _calculate_stock_scenario([800, 1200], 6000, 5.0)
+    assert first == second
+    assert first is not second
+
+
+def test_parse_lengths_to_mm_matches_scalar_parser():
+    values = ["2500", "2500.0", " 12 m", "1,5m", "30cm", "5mm", "m", "", "abc", "-5", "0.4"]
+    parsed = parse_lengths_to_mm(pd.Series(values)).tolist()
+    expected = [parse_length_to_mm(v) for v in values]
+    assert [None if pd.isna(v) else v for v in parsed] == expected
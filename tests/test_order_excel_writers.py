@@ -0,0 +1,38 @@
+from openpyxl import load_workbook
+
+import orders
+from en1090 import EN1090_NOTE_TEXT
+
+
+def _cells(path):
+    sheet = load_workbook(path).active
+    return [
+        (cell.coordinate, cell.value, bool(cell.font.b), cell.alignment.horizontal)
+        for row in sheet.iter_rows()
+        for cell in row
+        if cell.value not in (None, "")
+    ]
+
+
+def test_raw_xlsx_matches_library_writer(tmp_path, monkeypatch):
+    items = [
+        {
+            "PartNumber": f"P{i} <&>",
+            "Description": "Plaat",
+            "Materiaal": "S235",
+            "Aantal": i,
+            "Oppervlakte": 1.25,
+            "Gewicht": None,
+        }
+        for i in range(5)
+    ]
+    monkeypatch.setattr(orders, "_RAW_XLSX_MIN_ITEMS", 10**9)
+    orders.write_order_excel(str(tmp_path / "lib.xlsx"), items, en1090_required=True)
+    monkeypatch.setattr(orders, "_RAW_XLSX_MIN_ITEMS", 0)
+    orders.write_order_excel(str(tmp_path / "raw.xlsx"), items, en1090_required=True)
+
+    raw = _cells(tmp_path / "raw.xlsx")
+    assert raw == _cells(tmp_path / "lib.xlsx")
+    assert ("B4", "Plaat", False, "left") in raw
+    assert raw[-1][1:3] == (EN1090_NOTE_TEXT, True)
+    assert load_workbook(tmp_path / "raw.xlsx").active.column_dimensions["A"].width == 25